@@ -1,68 +1,153 @@
 """The entrypoint for the publicly hosted Agents.md Generator MCP Server."""
 
+import asyncio
 import os
+from collections import Counter
+from contextlib import suppress
 from logging import Logger
 from pathlib import Path
 from typing import Literal
 
 import click
+from fastmcp.exceptions import ToolError
 from fastmcp.server.middleware.logging import LoggingMiddleware
 from fastmcp.server.server import FastMCP
 from fastmcp.tools import Tool
 from fastmcp.utilities.logging import configure_logging, get_logger
 
-from github_research_mcp.clients.cache import get_cache_backend
-from github_research_mcp.clients.github import GitHubResearchClient
+from github_research_mcp.clients.cache import close_cache_backend, get_cache_backend
+from github_research_mcp.clients.github import get_github_research_client
 from github_research_mcp.sampling.handler import get_sampling_handler
 from github_research_mcp.servers.code import CodeServer
 from github_research_mcp.servers.research import ResearchServer
+from github_research_mcp.servers.shared.middleware import NormalizeOwnerRepoMiddleware, new_logging_middleware
 from github_research_mcp.servers.summary import RepositorySummary, SummaryServer
+from github_research_mcp.utilities.event_loop import get_event_loop_factory
 from github_research_mcp.utilities.stars import check_minimum_stars, check_owner_allowlist, get_minimum_stars
-from github_research_mcp.vendored.caching import CacheProtocol, MethodSettings, ResponseCachingMiddleware
+from github_research_mcp.vendored.caching import (
+    CacheProtocol,
+    CallToolSettings,
+    MethodSettings,
+    ResponseCachingMiddleware,
+    ToolSettings,
+)
 
 logger: Logger = get_logger(__name__)
 
 configure_logging()
 
+ONE_HOUR_IN_SECONDS = 60 * 60
+ONE_WEEK_IN_SECONDS = ONE_HOUR_IN_SECONDS * 24 * 7
+
+# Each summarization fans out into many GitHub requests, so concurrent summarizations are bounded to stay under rate limits
+SUMMARIZE_CONCURRENCY = int(os.getenv("SUMMARIZE_CONCURRENCY", "8"))
+SUMMARIZE_TIMEOUT_SECONDS = int(os.getenv("SUMMARIZE_TIMEOUT_SECONDS", "300"))
+
+summarize_semaphore: asyncio.Semaphore = asyncio.Semaphore(SUMMARIZE_CONCURRENCY)
+
+METHOD_SETTINGS: MethodSettings = MethodSettings(
+    call_tool=CallToolSettings(
+        ttl=ONE_WEEK_IN_SECONDS,
+        tool_settings={
+            "generate_agents_md": ToolSettings(ttl=ONE_WEEK_IN_SECONDS, negative_ttl=ONE_HOUR_IN_SECONDS),
+        },
+    ),
+)
+
+# The middleware is stateless configuration (plus the shared cache backend), so it is shared by every server instance
+logging_middleware: LoggingMiddleware = new_logging_middleware(logger=logger)
+normalize_owner_repo_middleware: NormalizeOwnerRepoMiddleware = NormalizeOwnerRepoMiddleware()
+cache_backend: CacheProtocol = get_cache_backend()
+response_caching_middleware: ResponseCachingMiddleware = ResponseCachingMiddleware(
+    cache_backend=cache_backend,
+    method_settings=METHOD_SETTINGS,
+)
+
 
 def new_mcp_server():
     clone_dir: Path = Path(os.getenv("CLONE_DIR", "tmp"))
-    if not clone_dir.exists():
-        clone_dir.mkdir(parents=True, exist_ok=True)
+    clone_dir.mkdir(parents=True, exist_ok=True)
 
-    one_week_in_seconds = 60 * 60 * 24 * 7
-
-    research_server: ResearchServer = ResearchServer(research_client=GitHubResearchClient())
+    research_server: ResearchServer = ResearchServer(research_client=get_github_research_client())
     summary_server: SummaryServer = SummaryServer(research_server=research_server, code_server=CodeServer(clone_dir=clone_dir))
 
+    in_flight_summaries: dict[tuple[str, str], asyncio.Task[RepositorySummary]] = {}
+
+    # The number of requests waiting for each in-flight summarization, it is only cancelled once none of them want it
+    summary_waiters: Counter[asyncio.Task[RepositorySummary]] = Counter()
+
+    async def summarize_repository(owner: str, repo: str) -> RepositorySummary:
+        """Summarize a repository once a summarization slot is available, giving up after the summarization timeout."""
+
+        async with summarize_semaphore:
+            return await asyncio.wait_for(summary_server.summarize_repository(owner=owner, repo=repo), timeout=SUMMARIZE_TIMEOUT_SECONDS)
+
+    def start_summary(owner: str, repo: str) -> asyncio.Task[RepositorySummary]:
+        """Start summarizing a repository, concurrent requests for the same repository share a single summarization."""
+
+        key: tuple[str, str] = (owner.lower(), repo.lower())
+
+        if not (summary_task := in_flight_summaries.get(key)):
+            summary_task = asyncio.create_task(summarize_repository(owner=owner, repo=repo))
+            in_flight_summaries[key] = summary_task
+            summary_task.add_done_callback(lambda _: in_flight_summaries.pop(key, None))
+
+        summary_waiters[summary_task] += 1
+
+        return summary_task
+
+    def release_summary(summary_task: asyncio.Task[RepositorySummary]) -> bool:
+        """Stop waiting for a summarization, returning whether other requests are still waiting for it."""
+
+        summary_waiters[summary_task] -= 1
+
+        if summary_waiters[summary_task] > 0:
+            return True
+
+        del summary_waiters[summary_task]
+        return False
+
+    async def cancel_summary(summary_task: asyncio.Task[RepositorySummary]) -> None:
+        """Stop waiting for a summarization, cancelling it unless other requests are still waiting for it."""
+
+        if release_summary(summary_task=summary_task):
+            return
+
+        if summary_task.cancel():
+            with suppress(asyncio.CancelledError):
+                await summary_task
+
     async def generate_agents_md(owner: str, repo: str) -> RepositorySummary:
-        if not await check_minimum_stars(
-            research_client=research_server.research_client, owner=owner, repo=repo
-        ) and not check_owner_allowlist(owner=owner):
+        # Most requests are for eligible repositories, so the summary is started while eligibility is checked
+        summary_task: asyncio.Task[RepositorySummary] = start_summary(owner=owner, repo=repo)
+
+        # Rejections are raised as ToolErrors so that the response caching middleware can negatively cache them
+        try:
+            has_minimum_stars: bool = await check_minimum_stars(research_client=research_server.research_client, owner=owner, repo=repo)
+        except ValueError as e:
+            await cancel_summary(summary_task=summary_task)
+            raise ToolError(str(e)) from None
+
+        if not has_minimum_stars and not check_owner_allowlist(owner=owner):
+            await cancel_summary(summary_task=summary_task)
             msg = (
                 f"Repository {owner}/{repo} is not eligible for AGENTS.md generation, "
                 f"it has less than {get_minimum_stars()} stars and is not explicitly allowlisted."
             )
-            raise ValueError(msg)
-
-        return await summary_server.summarize_repository(owner=owner, repo=repo)
-
-    cache_backend: CacheProtocol = get_cache_backend()
-    response_caching_middleware: ResponseCachingMiddleware = ResponseCachingMiddleware(
-        cache_backend=cache_backend,
-        method_settings=MethodSettings(
-            call_tool={
-                "ttl": one_week_in_seconds,
-            },
-        ),
-    )
+            raise ToolError(msg)
+
+        # Shield the summarization so that a cancelled request does not cancel it for the other requests awaiting it
+        try:
+            return await asyncio.shield(summary_task)
+        finally:
+            _ = release_summary(summary_task=summary_task)
 
     return FastMCP[None](
         name="Agents.md Generator",
         sampling_handler=get_sampling_handler(),
         sampling_handler_behavior="always",
         tools=[Tool.from_function(fn=generate_agents_md)],
-        middleware=[LoggingMiddleware(include_payloads=True, logger=logger), response_caching_middleware],
+        middleware=[logging_middleware, normalize_owner_repo_middleware, response_caching_middleware],
     )
 
 
@@ -71,10 +156,21 @@ mcp: FastMCP[None] = new_mcp_server()
 
 @click.command()
 @click.option(
-    "--mcp-transport", type=click.Choice(["stdio", "streamable-http"]), default="stdio", help="The transport to run the MCP server on"
+    "--mcp-transport",
+    type=click.Choice(["stdio", "streamable-http"]),
+    default="stdio",
+    envvar="MCP_TRANSPORT",
+    help="The transport to run the MCP server on",
 )
 def run_mcp(mcp_transport: Literal["stdio", "streamable-http"]):
-    mcp.run(transport=mcp_transport)
+    asyncio.run(run_mcp_async(mcp_transport=mcp_transport), loop_factory=get_event_loop_factory())
+
+
+async def run_mcp_async(mcp_transport: Literal["stdio", "streamable-http"]):
+    try:
+        await mcp.run_async(transport=mcp_transport)
+    finally:
+        await close_cache_backend()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,24 @@
-from github_research_mcp.clients.elasticsearch import get_elasticsearch_client
+from functools import cache
+
+from github_research_mcp.clients.elasticsearch import close_elasticsearch_client, get_elasticsearch_client
 from github_research_mcp.vendored.caching import CacheProtocol, InMemoryCache
-from github_research_mcp.vendored.elasticsearch_cache import ElasticsearchCache
 
 
+@cache
 def get_cache_backend() -> CacheProtocol:
+    """Get the shared cache backend, the backend is created once per process."""
+
     if elasticsearch_client := get_elasticsearch_client():
+        from github_research_mcp.vendored.elasticsearch_cache import ElasticsearchCache
+
         return ElasticsearchCache(elasticsearch_client=elasticsearch_client)
 
     return InMemoryCache()
+
+
+async def close_cache_backend() -> None:
+    """Close the connections held by the shared cache backend."""
+
+    await close_elasticsearch_client()
+
+    get_cache_backend.cache_clear()
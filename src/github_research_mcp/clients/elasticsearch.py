@@ -1,18 +1,46 @@
 import os
+from functools import cache
+from typing import TYPE_CHECKING
 
-from elasticsearch import AsyncElasticsearch
+if TYPE_CHECKING:
+    from elasticsearch import AsyncElasticsearch
 
+ELASTICSEARCH_CONNECTIONS_PER_NODE = 32
+ELASTICSEARCH_REQUEST_TIMEOUT_SECONDS = 10
+ELASTICSEARCH_MAX_RETRIES = 2
+
+
+@cache
+def get_elasticsearch_client() -> "AsyncElasticsearch | None":
+    """Get the shared Elasticsearch client, the client (and its connection pool) is created once per process.
+
+    The elasticsearch package is only imported once a client is configured, keeping it out of the startup path of
+    servers that do not use it."""
 
-def get_elasticsearch_client() -> AsyncElasticsearch | None:
     if not (host := os.getenv("ES_URL")):
         return None
 
     if not (api_key := os.getenv("ES_API_KEY")):
         return None
 
+    from elasticsearch import AsyncElasticsearch
+
     return AsyncElasticsearch(
         hosts=[host],
         api_key=api_key,
+        connections_per_node=ELASTICSEARCH_CONNECTIONS_PER_NODE,
         http_compress=True,
+        sniff_on_start=False,
+        request_timeout=ELASTICSEARCH_REQUEST_TIMEOUT_SECONDS,
+        max_retries=ELASTICSEARCH_MAX_RETRIES,
         retry_on_timeout=True,
     )
+
+
+async def close_elasticsearch_client() -> None:
+    """Close the shared Elasticsearch client, if one was configured."""
+
+    if elasticsearch_client := get_elasticsearch_client():
+        await elasticsearch_client.close()
+
+    get_elasticsearch_client.cache_clear()
@@ -1,36 +1,52 @@
-ExtraInfoType = dict[str, str | None]
+from collections.abc import Mapping
+from functools import cached_property
+from typing import override
+
+ExtraInfoType = Mapping[str, str | None]
 
 
 class ClientError(Exception):
     """A request error from the GitHub Research client."""
 
+    message: str
+    extra_info: ExtraInfoType | None
+
     def __init__(self, message: str, extra_info: ExtraInfoType | None = None):
-        msg = message
-        if extra_info:
-            msg += " (" + ", ".join([f"{key}: {value}" for key, value in extra_info.items() if value is not None]) + ")"
-        super().__init__(msg)
+        self.message = message
+        self.extra_info = extra_info
+        super().__init__(message)
+
+    @cached_property
+    def rendered_message(self) -> str:
+        """The message with the extra info appended, only rendered when the error is displayed."""
+        if not self.extra_info:
+            return self.message
+
+        return self.message + " (" + ", ".join(f"{key}: {value}" for key, value in self.extra_info.items() if value is not None) + ")"
+
+    @override
+    def __str__(self) -> str:
+        return self.rendered_message
 
 
 class RequestError(ClientError):
     """A request error from the GitHub Research client."""
 
     def __init__(self, action: str, message: str | None = None, extra_info: ExtraInfoType | None = None):
-        if not extra_info:
-            extra_info = {}
-        super().__init__(message="A request error occured.", extra_info={"action": action, "message": message, **extra_info})
+        request_extra_info: dict[str, str | None] = {"action": action, "message": message}
+        if extra_info:
+            request_extra_info.update(extra_info)
+        super().__init__(message="A request error occured.", extra_info=request_extra_info)
 
 
 class ResourceNotFoundError(RequestError):
     """A not found error from the GitHub Research client."""
 
     def __init__(self, action: str, resource: str | None = None, extra_info: ExtraInfoType | None = None):
-        if not extra_info:
-            extra_info = {}
-        super().__init__(
-            action=action,
-            message="The resource could not be found.",
-            extra_info={"resource": resource, **extra_info},
-        )
+        resource_extra_info: dict[str, str | None] = {"resource": resource}
+        if extra_info:
+            resource_extra_info.update(extra_info)
+        super().__init__(action=action, message="The resource could not be found.", extra_info=resource_extra_info)
 
 
 class ResourceTypeMismatchError(RequestError):
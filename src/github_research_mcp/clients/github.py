@@ -1,17 +1,30 @@
 import asyncio
 import os
-from collections.abc import Awaitable, Callable, Sequence
+import random
+import ssl
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Mapping, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from datetime import timedelta
+from functools import cache
+from itertools import batched
 from logging import Logger, getLogger
-from typing import TYPE_CHECKING, Any, Literal, overload
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeGuard, overload, override
+from weakref import WeakKeyDictionary
 
+import hishel
+import httpx
+from cachetools import TTLCache
 from githubkit import GitHub as GitHubKit
 from githubkit.auth.token import TokenAuthStrategy
+from githubkit.cache import MemCacheStrategy
 from githubkit.exception import GitHubException as GitHubKitGitHubException
 from githubkit.exception import GraphQLFailed as GitHubKitGraphQLFailed
 from githubkit.exception import RequestFailed as GitHubKitRequestFailed
 from githubkit.response import Response
 from githubkit.response import Response as GitHubKitResponse
-from githubkit.retry import RetryChainDecision, RetryRateLimit, RetryServerError
+from githubkit.retry import RetryChainDecision, RetryDecisionFunc, RetryOption, RetryRateLimit, RetryServerError
+from githubkit.throttling import BaseThrottler
+from githubkit.typing import URLTypes
 from githubkit.versions.v2022_11_28.models import ContentFile as GitHubKitContentFile
 from pydantic import BaseModel
 
@@ -23,7 +36,9 @@ from github_research_mcp.clients.models.github import (
     RepositoryFileWithContent,
 )
 from github_research_mcp.models.graphql.base import BaseGqlQuery
+from github_research_mcp.models.graphql.blobs import GET_BLOBS_BATCH_SIZE, GqlBlob, GqlGetBlobs
 from github_research_mcp.models.graphql.issue_or_pull_request import (
+    Comment,
     GqlGetIssue,
     GqlGetPullRequest,
     GqlIssueWithDetails,
@@ -39,23 +54,42 @@ if TYPE_CHECKING:
     from githubkit.versions.v2022_11_28.models import GitTree as GitHubKitGitTree
 
 NOT_FOUND_ERROR = 404
+# Returned by GitHub when a diff exceeds the limits of the diff media type
+NOT_ACCEPTABLE_ERROR = 406
+
+DIFF_MEDIA_TYPE = "application/vnd.github.diff"
+
+# GitHub resolves HEAD to the default branch server-side, which saves looking up the repository first
+DEFAULT_REF = "HEAD"
 
 GITHUBKIT_RESPONSE_TYPE = BaseModel | Sequence[BaseModel]
 
 
+def normalize_keywords(keywords: set[str]) -> set[str]:
+    """GitHub search is case-insensitive, so keywords that only differ by case or surrounding whitespace are the same search."""
+    return {keyword.strip().lower() for keyword in keywords if keyword.strip()}
+
+
+# Backslashes and quotes are escaped with backslashes in a single translate pass
+KEYWORD_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
 def escape_keywords(keywords: set[str]) -> list[str]:
-    # escape backslashes with more backslashes
-    escaped_keywords = [keyword.replace("\\", "\\\\") for keyword in keywords]
+    # Sorting keeps the query (and so its cache key) stable across calls
+    return [f'"{keyword.translate(KEYWORD_ESCAPE_TABLE)}"' for keyword in sorted(keywords)]
 
-    # escape quotes with backslashes
-    escaped_keywords = [keyword.replace('"', '\\"') for keyword in escaped_keywords]
 
-    return [f'"{keyword}"' for keyword in escaped_keywords]
+# GitHub rejects searches with more than five AND, OR, or NOT operators
+MAX_SEARCH_KEYWORDS = 6
 
 
 def build_query(
     owner: str, repo: str, keywords: set[str], is_issue: bool = False, is_pull_request: bool = False, all_keywords: bool = False
 ) -> str:
+    if len(keywords) > MAX_SEARCH_KEYWORDS:
+        msg = f"Cannot search for more than {MAX_SEARCH_KEYWORDS} keywords at once, got {len(keywords)}."
+        raise ValueError(msg)
+
     query_parts: list[str] = [
         f"repo:{owner}/{repo}",
     ]
@@ -79,6 +113,19 @@ def build_query(
     return " ".join(query_parts)
 
 
+def make_request_key(name: str, arguments: Mapping[str, Any], /) -> tuple[Any, ...] | None:
+    """Build a key identifying a request by its name and arguments, or None if the arguments are not hashable."""
+
+    request_key: tuple[Any, ...] = (name, *sorted(arguments.items()))
+
+    try:
+        _ = hash(request_key)
+    except TypeError:
+        return None
+
+    return request_key
+
+
 def extract_response[T: GITHUBKIT_RESPONSE_TYPE](response: Response[T], /) -> T:
     """Extract the response from a response."""
 
@@ -86,17 +133,234 @@ def extract_response[T: GITHUBKIT_RESPONSE_TYPE](response: Response[T], /) -> T:
 
 
 TRUNCATION_MARKER = "... [the middle portion has been truncated, retrieve object directly to get the full body]"
+MIDDLE_TRUNCATION_SEPARATOR = "\n\n" + TRUNCATION_MARKER + " ... " + "\n\n"
 
 
 def get_github_token() -> str:
-    env_vars: set[str] = {"GITHUB_TOKEN", "GITHUB_PERSONAL_ACCESS_TOKEN"}
-    for env_var in env_vars:
-        if env_var in os.environ:
-            return os.environ[env_var]
+    # GITHUB_TOKEN takes precedence when both are set
+    if token := os.getenv("GITHUB_TOKEN") or os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN"):
+        return token
+
     msg = "GITHUB_TOKEN or GITHUB_PERSONAL_ACCESS_TOKEN must be set"
     raise ValueError(msg)
 
 
+# HTTP/2 multiplexes concurrent requests over a few connections, rather than a connection per concurrent request
+GITHUB_MAX_CONNECTIONS = 16
+GITHUB_MAX_KEEPALIVE_CONNECTIONS = 16
+# GitHub closes idle connections after roughly 90 seconds, expire them just before it does
+GITHUB_KEEPALIVE_EXPIRY_SECONDS = 85
+GITHUB_TIMEOUT_SECONDS = 30
+GITHUB_CONNECT_TIMEOUT_SECONDS = 10
+
+# GitHubKit revalidates cached REST responses with their ETags, and 304 Not Modified responses do not count against the
+# rate limit, so the cache is sized for the repositories, trees, refs and files of a research session
+GITHUB_HTTP_CACHE_MAX_ENTRIES = 512
+
+# A random delay is added to each retry, so that a fan-out of failed requests does not retry in lockstep. It grows from
+# the base delay with each attempt, up to the maximum
+GITHUB_RETRY_JITTER_BASE_SECONDS = 1.0
+GITHUB_RETRY_JITTER_MAX_SECONDS = 30.0
+
+# GitHub allows no more than 100 concurrent requests, the limit is halved whenever GitHub reports a rate limit
+GITHUB_MAX_CONCURRENT_REQUESTS = 100
+GITHUB_MIN_CONCURRENT_REQUESTS = 2
+RATE_LIMITED_STATUS_CODES = {403, 429}
+
+
+class AdaptiveThrottler(BaseThrottler):
+    """Limits the number of concurrent GitHub requests, adapting the limit to GitHub's rate limiting.
+
+    The limit is halved whenever a response reports a rate limit and grows back by one request for every successful
+    response, so a fan-out backs off under pressure instead of tripping GitHub's secondary rate limits repeatedly."""
+
+    max_concurrency: int
+    min_concurrency: int
+    concurrency: int
+    in_flight: int
+
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1) -> None:
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.concurrency = max_concurrency
+        self.in_flight = 0
+        self._condition: asyncio.Condition | None = None
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def record_response(self, response: httpx.Response) -> None:
+        """Adapt the concurrency limit to a response received from GitHub."""
+
+        rate_limited: bool = response.status_code in RATE_LIMITED_STATUS_CODES and (
+            "retry-after" in response.headers or response.headers.get("x-ratelimit-remaining") == "0"
+        )
+
+        if rate_limited:
+            self.concurrency = max(self.min_concurrency, self.concurrency // 2)
+        elif response.status_code < httpx.codes.BAD_REQUEST:
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+
+    @override
+    @contextmanager
+    def acquire(self, request: httpx.Request) -> Generator[None, Any, Any]:
+        # The research client only makes async requests
+        yield
+
+    @override
+    @asynccontextmanager
+    async def async_acquire(self, request: httpx.Request) -> AsyncGenerator[None, Any]:
+        async with self.condition:
+            _ = await self.condition.wait_for(lambda: self.in_flight < self.concurrency)
+            self.in_flight += 1
+
+        try:
+            yield
+        finally:
+            async with self.condition:
+                self.in_flight -= 1
+                self.condition.notify_all()
+
+
+class SharedAsyncHTTPTransport(httpx.AsyncHTTPTransport):
+    """An HTTP transport that outlives the clients using it.
+
+    GitHubKit creates (and closes) a new httpx client for every request made outside of its context manager, sharing a
+    transport that ignores those closes lets the connections be reused across requests."""
+
+    @override
+    async def aclose(self) -> None:
+        return None
+
+
+class GitHubKitClientDefaults(TypedDict):
+    """The arguments GitHubKit creates its httpx clients with, as returned by its `_get_client_defaults`."""
+
+    auth: httpx.Auth
+    base_url: httpx.URL
+    headers: dict[str, str]
+    timeout: httpx.Timeout
+    follow_redirects: bool
+    verify: bool | ssl.SSLContext
+    trust_env: bool
+    proxy: httpx.URL | str | httpx.Proxy | None
+
+
+def is_githubkit_client_defaults(client_defaults: Mapping[str, Any]) -> TypeGuard[GitHubKitClientDefaults]:
+    return frozenset(client_defaults) == GitHubKitClientDefaults.__required_keys__
+
+
+class PooledGitHubKit(GitHubKit[TokenAuthStrategy]):
+    """A GitHubKit client whose requests share a pool of connections and report their responses to its throttler.
+
+    GitHubKit does not accept a transport, so the shared transport is given to the httpx clients it creates for requests.
+    This relies on GitHubKit's private client factory and request method, which is why githubkit is pinned below 0.14."""
+
+    limits: httpx.Limits
+    http2: bool
+    async_transports: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncBaseTransport]
+
+    def __init__(self, *args: Any, limits: httpx.Limits, http2: bool = False, **kwargs: Any) -> None:  # pyright: ignore[reportAny]
+        super().__init__(*args, **kwargs)  # pyright: ignore[reportAny]
+        self.limits = limits
+        self.http2 = http2
+
+        # Connections belong to the event loop that opened them, so each event loop gets its own transport
+        self.async_transports = WeakKeyDictionary()
+
+    def get_async_transport(self) -> httpx.AsyncBaseTransport:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        if (async_transport := self.async_transports.get(loop)) is None:
+            async_transport = SharedAsyncHTTPTransport(http2=self.http2, limits=self.limits)
+            self.async_transports[loop] = async_transport
+
+        return async_transport
+
+    @override
+    def _create_async_client(self) -> httpx.AsyncClient:
+        client_defaults: dict[str, Any] = self._get_client_defaults()
+
+        if not is_githubkit_client_defaults(client_defaults):
+            msg = f"GitHubKit creates httpx clients with unexpected arguments: {sorted(client_defaults)}"
+            raise TypeError(msg)
+
+        if self.config.http_cache:
+            return hishel.AsyncCacheClient(
+                **client_defaults,
+                transport=self.get_async_transport(),
+                storage=self.config.cache_strategy.get_async_hishel_storage(),
+                controller=self.config.cache_strategy.get_hishel_controller(),
+            )
+
+        return httpx.AsyncClient(**client_defaults, transport=self.get_async_transport())
+
+    @override
+    async def _arequest(self, method: str, url: URLTypes, **kwargs: Any) -> httpx.Response:  # pyright: ignore[reportAny]
+        response: httpx.Response = await super()._arequest(method, url, **kwargs)  # pyright: ignore[reportAny, reportUnknownMemberType]
+
+        # Every attempt is reported, including the rate limited ones that GitHubKit retries
+        if isinstance(self.config.throttler, AdaptiveThrottler):
+            self.config.throttler.record_response(response)
+
+        return response
+
+
+class SizedMemCacheStrategy(MemCacheStrategy):
+    """An in-memory cache strategy whose HTTP response cache holds more than the 128 responses of the default one."""
+
+    max_entries: int
+    _hishel_async_storage: hishel.AsyncInMemoryStorage | None
+
+    def __init__(self, max_entries: int) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+
+    @override
+    def get_async_hishel_storage(self) -> hishel.AsyncInMemoryStorage:
+        if self._hishel_async_storage is None:
+            self._hishel_async_storage = hishel.AsyncInMemoryStorage(capacity=self.max_entries)
+        return self._hishel_async_storage
+
+
+class JitteredRetryDecision:
+    """Wraps a retry decision, adding a bounded random jitter to its delay.
+
+    The wrapped decisions already honor GitHub's Retry-After and X-RateLimit-Reset headers, jitter is only ever added so
+    retries never happen before GitHub asks for them, and is bounded so long rate limit resets are not stretched further."""
+
+    decision: RetryDecisionFunc
+    base_jitter: float
+    max_jitter: float
+
+    def __init__(
+        self,
+        decision: RetryDecisionFunc,
+        base_jitter: float = GITHUB_RETRY_JITTER_BASE_SECONDS,
+        max_jitter: float = GITHUB_RETRY_JITTER_MAX_SECONDS,
+    ) -> None:
+        self.decision = decision
+        self.base_jitter = base_jitter
+        self.max_jitter = max_jitter
+
+    def __call__(self, exc: GitHubKitGitHubException, retry_count: int) -> RetryOption:
+        retry_option: RetryOption = self.decision(exc, retry_count)
+
+        if not retry_option.do_retry or retry_option.retry_after is None:
+            return retry_option
+
+        jitter_seconds: float = random.uniform(0, min(self.max_jitter, self.base_jitter * 2.0**retry_count))  # noqa: S311
+
+        return RetryOption(True, retry_option.retry_after + timedelta(seconds=jitter_seconds))
+
+
+# Shared by every GitHubKit client so that conditional requests can be made for responses fetched by any of them
+github_cache_strategy: SizedMemCacheStrategy = SizedMemCacheStrategy(max_entries=GITHUB_HTTP_CACHE_MAX_ENTRIES)
+
+
 def get_githubkit_client() -> GitHubKit[Any]:
     # Retry server errors up to 3 times
     retry_server_error = RetryServerError()
@@ -109,7 +373,23 @@ def get_githubkit_client() -> GitHubKit[Any]:
         retry_rate_limit,
     )
 
-    return GitHubKit[TokenAuthStrategy](auth=TokenAuthStrategy(token=get_github_token()), auto_retry=retry_chain)
+    throttler = AdaptiveThrottler(max_concurrency=GITHUB_MAX_CONCURRENT_REQUESTS, min_concurrency=GITHUB_MIN_CONCURRENT_REQUESTS)
+
+    # httpx already negotiates gzip responses
+    return PooledGitHubKit(
+        auth=TokenAuthStrategy(token=get_github_token()),
+        auto_retry=JitteredRetryDecision(decision=retry_chain),
+        cache_strategy=github_cache_strategy,
+        throttler=throttler,
+        http_cache=True,
+        timeout=httpx.Timeout(GITHUB_TIMEOUT_SECONDS, connect=GITHUB_CONNECT_TIMEOUT_SECONDS),
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=GITHUB_MAX_CONNECTIONS,
+            max_keepalive_connections=GITHUB_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=GITHUB_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
 
 
 DEFAULT_ISSUE_COMMENTS_LIMIT = 5
@@ -123,15 +403,22 @@ DEFAULT_TRUNCATE_CHARACTERS = 4000
 
 DEFAULT_FIND_FILES_LIMIT = 100
 
+# Bursts of concurrent requests trip GitHub's secondary rate limits, so fan-outs of per-file requests are bounded
+DEFAULT_FANOUT_CONCURRENCY = 10
+
+REPOSITORY_CACHE_TTL_SECONDS = 5 * 60
+REPOSITORY_CACHE_MAX_ENTRIES = 1024
+GIT_REF_CACHE_TTL_SECONDS = 30
+GIT_REF_CACHE_MAX_ENTRIES = 1024
+GRAPHQL_CACHE_TTL_SECONDS = 60
+GRAPHQL_CACHE_MAX_ENTRIES = 512
+
 
 def trim_body(body: str, max_length: int) -> str:
     """If the body is longer than the max length, we take the first max_length / 2 characters and the last max_length / 2 characters."""
 
     if len(body) > max_length:
-        first_half = body[: max_length // 2]
-        middle_truncated_marker = TRUNCATION_MARKER + " ... "
-        last_half = body[-max_length // 2 :]
-        return (first_half + "\n\n" + middle_truncated_marker + "\n\n" + last_half).strip()
+        return "".join((body[: max_length // 2], MIDDLE_TRUNCATION_SEPARATOR, body[-max_length // 2 :])).strip()
 
     return body.strip()
 
@@ -141,6 +428,33 @@ def trim_comment_body(body: str, max_length: int) -> str:
     return trim_body(body, max_length)
 
 
+def trim_comment(comment: Comment, max_length: int) -> Comment:
+    """Trim the body of a comment, comments that are already within the limit are shared rather than copied."""
+
+    body: str = trim_comment_body(comment.body, max_length)
+
+    return comment if body == comment.body else comment.model_copy(update={"body": body})
+
+
+def trim_issue_or_pull_request_bodies[T: GqlIssueWithDetails | GqlPullRequestWithDetails](
+    issues_or_pull_requests: Sequence[T], limit_body_size: int, limit_comment_body_size: int
+) -> list[T]:
+    """Trim the bodies of issues or pull requests and their comments.
+
+    Trimmed copies are returned as the GraphQL responses are shared with cached and concurrent requests, which may ask for
+    different body sizes."""
+
+    return [
+        issue_or_pull_request.model_copy(
+            update={
+                "body": trim_body(issue_or_pull_request.body, limit_body_size),
+                "comments": [trim_comment(comment, limit_comment_body_size) for comment in issue_or_pull_request.comments],
+            }
+        )
+        for issue_or_pull_request in issues_or_pull_requests
+    ]
+
+
 class GitHubResearchClient:
     githubkit_client: GitHubKit[Any]
     logger: Logger
@@ -156,6 +470,9 @@ class GitHubResearchClient:
         log_requests: bool = True,
         log_responses: bool = False,
         log_on_error: bool = True,
+        *,
+        cache_graphql: bool = True,
+        fanout_concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
     ):
         self.githubkit_client = githubkit_client or get_githubkit_client()
         self.logger = logger or getLogger(__name__)
@@ -163,9 +480,37 @@ class GitHubResearchClient:
         self.log_responses = log_responses
         self.log_on_error = log_on_error
 
+        # Most requests do not override the logging flags, so the default loggers are resolved once
+        self.default_loggers: tuple[Callable[..., Any], Callable[..., Any], Callable[..., Any]] = self._resolve_loggers()
+
+        self.in_flight_requests: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+        self.fanout_semaphore: asyncio.Semaphore = asyncio.Semaphore(fanout_concurrency)
+
+        # Repository metadata (like the default branch) and refs are looked up repeatedly while researching a repository
+        self.repository_cache: TTLCache[tuple[str, str], Repository] = TTLCache(
+            maxsize=REPOSITORY_CACHE_MAX_ENTRIES, ttl=REPOSITORY_CACHE_TTL_SECONDS
+        )
+        self.git_ref_cache: TTLCache[tuple[str, str, str], GitReference] = TTLCache(
+            maxsize=GIT_REF_CACHE_MAX_ENTRIES, ttl=GIT_REF_CACHE_TTL_SECONDS
+        )
+
+        # Follow-up tool calls frequently repeat the same issue, pull request, and search queries
+        self.graphql_cache: TTLCache[tuple[Any, ...], BaseGqlQuery] | None = (
+            TTLCache(maxsize=GRAPHQL_CACHE_MAX_ENTRIES, ttl=GRAPHQL_CACHE_TTL_SECONDS) if cache_graphql else None
+        )
+
     def _get_loggers(
         self, log_request: bool | None = None, log_response: bool | None = None, log_on_error: bool | None = None
-    ) -> tuple[Callable[[str], Any], Callable[[str], Any], Callable[[BaseException | str], Any]]:
+    ) -> tuple[Callable[..., Any], Callable[..., Any], Callable[..., Any]]:
+        """Get the loggers for a request, messages are passed with %-style arguments so that they are only formatted when logged."""
+        if not (log_request or log_response or log_on_error):
+            return self.default_loggers
+
+        return self._resolve_loggers(log_request=log_request, log_response=log_response, log_on_error=log_on_error)
+
+    def _resolve_loggers(
+        self, log_request: bool | None = None, log_response: bool | None = None, log_on_error: bool | None = None
+    ) -> tuple[Callable[..., Any], Callable[..., Any], Callable[..., Any]]:
         request_logger = self.logger.info if log_request or self.log_requests else self.logger.debug
         response_logger = self.logger.info if log_response or self.log_responses else self.logger.debug
         error_logger = self.logger.exception if log_on_error or self.log_on_error else self.logger.debug
@@ -208,35 +553,56 @@ class GitHubResearchClient:
             log_request=log_request, log_response=log_response, log_on_error=log_on_error
         )
 
-        request_logger(f"Executing GraphQL query {query_model.__name__} with variables {variables}")
+        request_key: tuple[Any, ...] | None = make_request_key(query_model.__name__, variables)
+
+        if (
+            self.graphql_cache is not None
+            and request_key is not None
+            and isinstance(cached_response := self.graphql_cache.get(request_key), query_model)
+        ):
+            return cached_response
+
+        request_logger("Executing GraphQL query %s with variables %s", query_model.__name__, variables)
 
         try:
-            raw_response = await self.githubkit_client.async_graphql(
-                query=query_model.graphql_query(),
-                variables=variables,
+            raw_response = await self._coalesce_request(
+                key=request_key,
+                request=lambda: self.githubkit_client.async_graphql(query=query_model.cached_graphql_query(), variables=variables),
             )
         except GitHubKitGraphQLFailed as e:
             if errors := e.response.errors:
-                messages = ". ".join([error.message for error in errors])
+                error_messages: list[str] = []
+                not_found: bool = False
+
+                for error in errors:
+                    error_messages.append(error.message)
+                    not_found = not_found or error.type == "NOT_FOUND"
 
-                if any(error.type == "NOT_FOUND" for error in errors):
+                messages = ". ".join(error_messages)
+
+                if not_found:
                     if error_on_not_found:
                         error_logger(
-                            f"Resource not found executing GraphQL query {query_model.__name__} with variables {variables}: {messages}"
+                            "Resource not found executing GraphQL query %s with variables %s: %s", query_model.__name__, variables, messages
                         )
                         raise ResourceNotFoundError(action=f"Get {query_model.__name__}", extra_info={"graphql_errors": messages}) from e
 
                     return None
 
-                error_logger(f"Error executing GraphQL query {query_model.__name__} with variables {variables}: {messages}")
+                error_logger("Error executing GraphQL query %s with variables %s: %s", query_model.__name__, variables, messages)
 
                 raise RequestError(action=f"Get {query_model.__name__}", extra_info={"graphql_errors": messages}) from e
 
             raise RequestError(action=f"Get {query_model.__name__}", message="Unknown error: " + str(e)) from e
 
-        response_logger(f"Completed GraphQL query {query_model.__name__} for with variables {variables}.")
+        response_logger("Completed GraphQL query %s for with variables %s.", query_model.__name__, variables)
+
+        response: T = query_model.model_validate(raw_response)
+
+        if self.graphql_cache is not None and request_key is not None:
+            self.graphql_cache[request_key] = response
 
-        return query_model.model_validate(raw_response)
+        return response
 
     @overload
     async def _perform_rest_request[T: GITHUBKIT_RESPONSE_TYPE](
@@ -294,10 +660,13 @@ class GitHubResearchClient:
             log_request=log_request, log_response=log_response, log_on_error=log_on_error
         )
 
-        request_logger(f"Performing {action} using {method.__name__} with kwargs {request_args}")
+        request_logger("Performing %s using %s with kwargs %s", action, method.__name__, request_args)
 
         try:
-            response: GitHubKitResponse[T] = await method(**request_args)
+            response: GitHubKitResponse[T] = await self._coalesce_request(
+                key=make_request_key(method.__qualname__, request_args),
+                request=lambda: method(**request_args),
+            )
         except GitHubKitRequestFailed as e:
             if e.response.status_code == NOT_FOUND_ERROR:
                 if error_on_not_found:
@@ -305,25 +674,33 @@ class GitHubResearchClient:
 
                 return None
 
-            error_logger(f"RequestFailed error performing {action} using {method.__name__} with kwargs {request_args}: {e}")
+            error_logger("RequestFailed error performing %s using %s with kwargs %s: %s", action, method.__name__, request_args, e)
 
             raise RequestError(action=action, message=str(e)) from e
         except GitHubKitGitHubException as e:
-            error_logger(f"Error performing {action} using {method.__name__} with kwargs {request_args}: {e}")
+            error_logger("Error performing %s using %s with kwargs %s: %s", action, method.__name__, request_args, e)
 
             raise RequestError(action=action, message=str(e)) from e
 
         extracted_response = extract_response(response)
 
-        response_logger(f"Extracted response for {action} using {method.__name__} with kwargs {request_args}: {extracted_response}")
+        response_logger("Extracted response for %s using %s with kwargs %s: %s", action, method.__name__, request_args, extracted_response)
 
         return extracted_response
 
-    def _remove_exceptions[T: GITHUBKIT_RESPONSE_TYPE](self, results: Sequence[T | BaseException | None], /) -> list[T | None]:
-        return [result for result in results if result is not None and not isinstance(result, BaseException)]
+    async def _coalesce_request[T](self, key: tuple[Any, ...] | None, request: Callable[[], Awaitable[T]]) -> T:
+        """Perform a (read-only) request, concurrent callers making an identical request share a single round-trip."""
+
+        if key is None:
+            return await request()
+
+        if not (request_task := self.in_flight_requests.get(key)):
+            request_task = asyncio.ensure_future(request())
+            self.in_flight_requests[key] = request_task
+            request_task.add_done_callback(lambda _: self.in_flight_requests.pop(key, None))
 
-    def _remove_none[T: GITHUBKIT_RESPONSE_TYPE](self, results: Sequence[T | None], /) -> list[T]:
-        return [result for result in results if result is not None]
+        # Shield the request so that a cancelled caller does not cancel it for the other callers awaiting it
+        return await asyncio.shield(request_task)
 
     @overload
     async def get_repository(self, owner: str, repo: str, error_on_not_found: Literal[True] = True) -> Repository: ...
@@ -339,6 +716,11 @@ class GitHubResearchClient:
     ) -> Repository | None:
         """Get a repository."""
 
+        key: tuple[str, str] = (owner.lower(), repo.lower())
+
+        if repository := self.repository_cache.get(key):
+            return repository
+
         if githubkit_repository := await self._perform_rest_request(
             action="Get repository",
             log_request=True,
@@ -347,7 +729,8 @@ class GitHubResearchClient:
             owner=owner,
             repo=repo,
         ):
-            return Repository.from_full_repository(full_repository=githubkit_repository)
+            repository = self.repository_cache[key] = Repository.from_full_repository(full_repository=githubkit_repository)
+            return repository
 
         return None
 
@@ -481,6 +864,19 @@ class GitHubResearchClient:
     ) -> PullRequestDiff | None:
         """Get the diff of a pull request."""
 
+        try:
+            unified_diff: str | None = await self._get_unified_diff(owner=owner, repo=repo, pull_request_number=pull_request_number)
+        except ResourceNotFoundError:
+            if error_on_not_found:
+                raise
+
+            return None
+
+        if unified_diff is not None:
+            # Diffs can be megabytes of text, parsing them in a worker thread keeps the event loop responsive to other requests
+            return await asyncio.to_thread(PullRequestDiff.from_unified_diff, diff=unified_diff, truncate=truncate)
+
+        # GitHub refuses to render very large diffs, the per-file patches are still available from the files endpoint
         if response := await self._perform_rest_request(
             action="Get pull request diff",
             log_request=True,
@@ -490,10 +886,49 @@ class GitHubResearchClient:
             repo=repo,
             pull_number=pull_request_number,
         ):
-            return PullRequestDiff.from_diff_entries(diff_entries=response, truncate=truncate)
+            return await asyncio.to_thread(PullRequestDiff.from_diff_entries, diff_entries=response, truncate=truncate)
 
         return None
 
+    async def _get_unified_diff(self, owner: str, repo: str, pull_request_number: int) -> str | None:
+        """Get the whole unified diff of a pull request in a single request, returns None if the diff is too large for
+        GitHub to render.
+
+        Raises:
+            ResourceNotFoundError: If the pull request is not found.
+            RequestError: If the request fails.
+        """
+
+        action = "Get pull request diff"
+
+        request_logger, _, error_logger = self._get_loggers(log_request=True)
+
+        request_logger("Performing %s for %s/%s#%s", action, owner, repo, pull_request_number)
+
+        url: str = f"/repos/{owner}/{repo}/pulls/{pull_request_number}"
+
+        try:
+            response: GitHubKitResponse[Any] = await self._coalesce_request(
+                key=(DIFF_MEDIA_TYPE, url),
+                request=lambda: self.githubkit_client.arequest("GET", url, headers={"Accept": DIFF_MEDIA_TYPE}),  # pyright: ignore[reportUnknownMemberType]
+            )
+        except GitHubKitRequestFailed as e:
+            if e.response.status_code == NOT_FOUND_ERROR:
+                raise ResourceNotFoundError(action=action, resource=e.request.url.path) from e
+
+            if e.response.status_code == NOT_ACCEPTABLE_ERROR:
+                return None
+
+            error_logger("RequestFailed error performing %s for %s/%s#%s: %s", action, owner, repo, pull_request_number, e)
+
+            raise RequestError(action=action, message=str(e)) from e
+        except GitHubKitGitHubException as e:
+            error_logger("Error performing %s for %s/%s#%s: %s", action, owner, repo, pull_request_number, e)
+
+            raise RequestError(action=action, message=str(e)) from e
+
+        return response.text
+
     async def get_default_branch(self, owner: str, repo: str) -> str:
         """Get the default branch of a repository."""
 
@@ -517,6 +952,11 @@ class GitHubResearchClient:
             error_on_not_found: Whether to raise an error if the ref is not found.
         """
 
+        key: tuple[str, str, str] = (owner.lower(), repo.lower(), ref)
+
+        if git_reference := self.git_ref_cache.get(key):
+            return git_reference
+
         if git_ref := await self._perform_rest_request(
             action="Get git ref",
             log_request=True,
@@ -526,7 +966,8 @@ class GitHubResearchClient:
             repo=repo,
             ref=ref,
         ):
-            return GitReference.from_git_ref(git_ref=git_ref)
+            git_reference = self.git_ref_cache[key] = GitReference.from_git_ref(git_ref=git_ref)
+            return git_reference
 
         return None
 
@@ -576,9 +1017,6 @@ class GitHubResearchClient:
             error_on_not_found: Whether to raise an error if the file is not found.
         """
 
-        if ref is None:
-            ref = await self.get_default_branch(owner=owner, repo=repo)
-
         if file := await self._perform_rest_request(
             action="Get file",
             log_request=True,
@@ -587,7 +1025,7 @@ class GitHubResearchClient:
             owner=owner,
             repo=repo,
             path=path,
-            ref=ref,
+            ref=ref or DEFAULT_REF,
         ):
             if not isinstance(file, GitHubKitContentFile):
                 raise ResourceTypeMismatchError(
@@ -625,22 +1063,68 @@ class GitHubResearchClient:
         if not paths:
             return []
 
-        tasks: list[CoroutineType[Any, Any, RepositoryFileWithContent | None]] = [
-            self.get_file(
-                owner=owner,
-                repo=repo,
-                path=path,
-                ref=ref,
-                truncate_lines=truncate_lines,
-                truncate_characters=truncate_characters,
-                error_on_not_found=error_on_not_found,
-            )
-            for path in paths
-        ]
+        expression_ref: str = ref or DEFAULT_REF
+
+        batches: list[list[str]] = [list(batch) for batch in batched(paths, GET_BLOBS_BATCH_SIZE)]
+
+        gql_get_blobs_batches: list[GqlGetBlobs | None] = await asyncio.gather(
+            *[
+                self._perform_graphql_query(
+                    query_model=GqlGetBlobs,
+                    variables=GqlGetBlobs.to_graphql_query_variables(
+                        owner=owner, repo=repo, expressions=[f"{expression_ref}:{path}" for path in batch]
+                    ),
+                    error_on_not_found=error_on_not_found,
+                )
+                for batch in batches
+            ]
+        )
+
+        results: dict[str, RepositoryFileWithContent | None] = {}
+        fallback_paths: list[str] = []
+
+        for batch, gql_get_blobs in zip(batches, gql_get_blobs_batches, strict=True):
+            if gql_get_blobs is None:
+                continue
+
+            for index, path in enumerate(batch):
+                blob: GqlBlob | None = gql_get_blobs.get_blob(index=index)
+
+                if blob is None:
+                    if error_on_not_found:
+                        raise ResourceNotFoundError(action="Get file", resource=f"/repos/{owner}/{repo}/contents/{path}")
+                    continue
+
+                # Large files have their text truncated and non-files have no text, the REST API handles both of these
+                if not blob.is_blob or blob.is_truncated:
+                    fallback_paths.append(path)
+                    continue
+
+                results[path] = RepositoryFileWithContent.from_text(
+                    path=path, text=blob.text, truncate_lines=truncate_lines, truncate_characters=truncate_characters
+                )
+
+        async def get_fallback_file(path: str) -> RepositoryFileWithContent | None:
+            async with self.fanout_semaphore:
+                return await self.get_file(
+                    owner=owner,
+                    repo=repo,
+                    path=path,
+                    ref=ref,
+                    truncate_lines=truncate_lines,
+                    truncate_characters=truncate_characters,
+                    error_on_not_found=error_on_not_found,
+                )
 
-        results: list[RepositoryFileWithContent | None] = await asyncio.gather(*tasks)
+        if fallback_paths:
+            tasks: list[CoroutineType[Any, Any, RepositoryFileWithContent | None]] = [
+                get_fallback_file(path=path) for path in fallback_paths
+            ]
 
-        return self._remove_none(results)
+            results.update(zip(fallback_paths, await asyncio.gather(*tasks), strict=True))
+
+        # Files that were not found are left out, the rest are returned in the order they were requested
+        return [file for path in paths if (file := results.get(path)) is not None]
 
     async def find_file_paths(
         self,
@@ -669,16 +1153,17 @@ class GitHubResearchClient:
             limit_results: The maximum number of results to return.
         """
 
-        if ref is None:
-            ref = await self.get_default_branch(owner=owner, repo=repo)
-
         repository_tree: RepositoryTree = await self.get_repository_tree(owner=owner, repo=repo, ref=ref, depth=depth)
 
-        return FilteredRepositoryTree.from_repository_tree(
+        # Matching every path of a large monorepo against the patterns is CPU bound, run it off the event loop
+        filtered_tree: FilteredRepositoryTree = await asyncio.to_thread(
+            FilteredRepositoryTree.from_repository_tree,
             repository_tree=repository_tree,
             include_patterns=include_patterns,
             exclude_patterns=exclude_patterns,
-        ).truncate(limit_results=limit_results)
+        )
+
+        return filtered_tree.truncate(limit_results=limit_results)
 
     async def get_repository_tree(
         self,
@@ -696,9 +1181,6 @@ class GitHubResearchClient:
             depth: The depth of the tree to get. If not provided, the tree will be returned in its entirety. Depth 0 is the root directory.
         """
 
-        if ref is None:
-            ref = await self.get_default_branch(owner=owner, repo=repo)
-
         recursive: bool = depth is None or depth > 0
 
         tree: GitHubKitGitTree = await self._perform_rest_request(
@@ -708,11 +1190,12 @@ class GitHubResearchClient:
             method=self.githubkit_client.rest.git.async_get_tree,
             owner=owner,
             repo=repo,
-            tree_sha=ref or "main",
+            tree_sha=ref or DEFAULT_REF,
             recursive="1" if recursive else None,
         )
 
-        repository_tree: RepositoryTree = RepositoryTree.from_git_tree(git_tree=tree)
+        # Trees of large repositories have tens of thousands of entries, they are organized in a worker thread
+        repository_tree: RepositoryTree = await asyncio.to_thread(RepositoryTree.from_git_tree, git_tree=tree)
 
         if depth is not None:
             return PrunedRepositoryTree.from_repository_tree(repository_tree=repository_tree, depth=depth)
@@ -756,7 +1239,7 @@ class GitHubResearchClient:
     # ) -> list[RepositoryFileWithLineMatches]:
     #     """Search for code in a repository by the provided keywords."""
 
-    #     escaped_keywords: list[str] = [f'"{keyword}"' for keyword in sorted(keywords)]
+    #     escaped_keywords: list[str] = escape_keywords(keywords=keywords)
 
     #     keyword_query = " ".join(escaped_keywords)
 
@@ -799,12 +1282,11 @@ class GitHubResearchClient:
             variables=query_variables,
         )
 
-        for pull_request in gql_search_pull_requests.search:
-            pull_request.body = trim_body(pull_request.body, limit_pull_request_body_size)
-            for comment in pull_request.comments:
-                comment.body = trim_comment_body(comment.body, limit_comment_body_size)
-
-        return gql_search_pull_requests.search
+        return trim_issue_or_pull_request_bodies(
+            gql_search_pull_requests.search,
+            limit_body_size=limit_pull_request_body_size,
+            limit_comment_body_size=limit_comment_body_size,
+        )
 
     async def search_pull_requests_by_keywords(
         self,
@@ -830,6 +1312,12 @@ class GitHubResearchClient:
             limit_related_items: The maximum number of related items to include in the search results.
         """
 
+        keywords = normalize_keywords(keywords)
+
+        # Without keywords the search would match every pull request in the repository
+        if not keywords:
+            return []
+
         query: str = build_query(
             owner=owner,
             repo=repo,
@@ -871,12 +1359,11 @@ class GitHubResearchClient:
             variables=query_variables,
         )
 
-        for issue in gql_search_issues.search:
-            issue.body = trim_body(issue.body, limit_issue_body_size)
-            for comment in issue.comments:
-                comment.body = trim_comment_body(comment.body, limit_comment_body_size)
-
-        return gql_search_issues.search
+        return trim_issue_or_pull_request_bodies(
+            gql_search_issues.search,
+            limit_body_size=limit_issue_body_size,
+            limit_comment_body_size=limit_comment_body_size,
+        )
 
     async def search_issues_by_keywords(
         self,
@@ -902,6 +1389,12 @@ class GitHubResearchClient:
             limit_related_items: The maximum number of related items to include in the search results.
         """
 
+        keywords = normalize_keywords(keywords)
+
+        # Without keywords the search would match every issue in the repository
+        if not keywords:
+            return []
+
         query: str = build_query(
             owner=owner,
             repo=repo,
@@ -918,3 +1411,14 @@ class GitHubResearchClient:
             limit_issue_body_size=limit_issue_body_size,
             limit_comment_body_size=limit_comment_body_size,
         )
+
+
+@cache
+def get_github_research_client() -> GitHubResearchClient:
+    """Get the shared GitHub research client, the client (and its connection pool) is created once per process."""
+
+    research_client: GitHubResearchClient = GitHubResearchClient()
+
+    research_client.logger.info("Created the shared GitHub research client, it will be reused for the lifetime of the process.")
+
+    return research_client
@@ -1,5 +1,9 @@
 import base64
+import re
+from bisect import bisect_right
+from collections.abc import Sequence
 from datetime import datetime
+from itertools import accumulate, islice
 from typing import ClassVar, Literal, Self
 
 from fastmcp.utilities.logging import get_logger
@@ -28,6 +32,13 @@ DEFAULT_README_TRUNCATE_CONTENT_LINES = 2000
 DEFAULT_README_TRUNCATE_CONTENT_CHARACTERS = 60000
 
 
+def count_lines_within_characters(lines: Sequence[str], truncate_characters: int) -> int:
+    """Count the leading lines whose combined length is within the character limit."""
+
+    # The running total of characters is non-decreasing, so the cutoff is found by bisection
+    return bisect_right(list(accumulate(map(len, lines))), truncate_characters)
+
+
 class FileLines(RootModel[dict[int, str]]):
     """A dictionary of line numbers and content pairs."""
 
@@ -39,21 +50,25 @@ class FileLines(RootModel[dict[int, str]]):
 
         return cls(root=file_lines)
 
-    def truncate(self, truncate_lines: int, truncate_characters: int) -> Self:
-        total_characters: int = 0
-        new_lines: dict[int, str] = {}
+    @classmethod
+    def from_text_truncated(cls, text: str, truncate_lines: int, truncate_characters: int) -> Self:
+        """Build the truncated lines of a text in one pass, without building the lines that truncation would drop."""
 
-        for line_number, line in self.root.items():
-            if line_number > truncate_lines:
-                break
+        # At most truncate_characters characters across at most truncate_lines lines (and their newlines) are kept, so only
+        # that prefix of a large text is split, and only into as many lines as can be kept
+        lines: list[str] = text[: truncate_characters + truncate_lines].split("\n", truncate_lines)[:truncate_lines]
 
-            total_characters += len(line)
-            if total_characters > truncate_characters:
-                break
+        line_count: int = count_lines_within_characters(lines=lines, truncate_characters=truncate_characters)
 
-            new_lines[line_number] = line
+        return cls(root={i + 1: line for i, line in enumerate(lines[:line_count])})
 
-        return self.model_copy(update={"root": new_lines})
+    def truncate(self, truncate_lines: int, truncate_characters: int) -> Self:
+        # Line numbers are sequential from 1, so the lines within the line limit are a prefix of the dict
+        lines: list[str] = list(islice(self.root.values(), truncate_lines))
+
+        line_count: int = count_lines_within_characters(lines=lines, truncate_characters=truncate_characters)
+
+        return self.model_copy(update={"root": dict(islice(self.root.items(), line_count))})
 
 
 class RepositoryLicense(BaseModel):
@@ -135,23 +150,34 @@ class RepositoryFileWithContent(BaseModel):
         truncate_lines: int = DEFAULT_TRUNCATE_CONTENT_LINES,
         truncate_characters: int = DEFAULT_TRUNCATE_CONTENT_CHARACTERS,
     ) -> Self:
-        content: str | None = None
-        encoding: str = "binary"
-        file_lines: FileLines | None = None
+        text: str | None = None
 
         if content_file.encoding == "base64":
-            content_bytes: bytes = base64.b64decode(content_file.content)
-            if content_text := try_decode_base64_utf8(content_bytes):
-                content = content_text
-                encoding = "utf-8"
-                file_lines = FileLines.from_text(text=content)
+            text = try_decode_base64_utf8(base64.b64decode(content_file.content))
+
+        return cls.from_text(path=content_file.path, text=text, truncate_lines=truncate_lines, truncate_characters=truncate_characters)
+
+    @classmethod
+    def from_text(
+        cls,
+        path: str,
+        text: str | None,
+        truncate_lines: int = DEFAULT_TRUNCATE_CONTENT_LINES,
+        truncate_characters: int = DEFAULT_TRUNCATE_CONTENT_CHARACTERS,
+    ) -> Self:
+        """Build a file from its decoded text, files without text are treated as binary."""
+
+        if not text:
+            return cls(path=path, encoding="binary", content=None, total_lines=None)
 
-        total_lines: int | None = len(file_lines.root) if file_lines else None
+        total_lines: int = text.count("\n") + 1
 
-        return cls(path=content_file.path, encoding=encoding, content=file_lines, total_lines=total_lines).truncate(
-            truncate_lines=truncate_lines, truncate_characters=truncate_characters
+        file_lines: FileLines = FileLines.from_text_truncated(
+            text=text, truncate_lines=truncate_lines, truncate_characters=truncate_characters
         )
 
+        return cls(path=path, encoding="utf-8", content=file_lines, total_lines=total_lines)
+
     def truncate(self, truncate_lines: int, truncate_characters: int) -> Self:
         if self.content is None:
             return self
@@ -199,6 +225,40 @@ class GitReference(BaseModel):
         return cls(name=git_ref.ref, sha=git_ref.object_.sha, ref_type=git_ref.object_.type)
 
 
+GIT_QUOTED_PATH_PATTERN = r'"(?:[^"\\]|\\.)*"'
+GIT_QUOTED_PATH_ESCAPE_PATTERN = re.compile(rb"\\([0-7]{3}|.)", flags=re.DOTALL)
+GIT_QUOTED_PATH_ESCAPES: dict[bytes, bytes] = {b"a": b"\a", b"b": b"\b", b"t": b"\t", b"n": b"\n", b"v": b"\v", b"f": b"\f", b"r": b"\r"}
+
+DIFF_GIT_HEADER_PATTERN = re.compile(rf"(?P<old>{GIT_QUOTED_PATH_PATTERN}|a/.*?) (?P<new>{GIT_QUOTED_PATH_PATTERN}|b/.*)")
+
+
+def unquote_git_path(path: str) -> str:
+    """Unquote a path that git quoted C-style (e.g. `"a/caf\\303\\251.txt"`) because it contains special characters."""
+    if len(path) <= 1 or not path.startswith('"') or not path.endswith('"'):
+        return path
+
+    def unescape(match: re.Match[bytes]) -> bytes:
+        escaped: bytes = match.group(1)
+        return bytes([int(escaped, 8) & 0xFF]) if len(escaped) > 1 else GIT_QUOTED_PATH_ESCAPES.get(escaped, escaped)
+
+    return GIT_QUOTED_PATH_ESCAPE_PATTERN.sub(unescape, path[1:-1].encode()).decode("utf-8", errors="replace")
+
+
+def split_diff_git_header(header: str) -> tuple[str, str]:
+    """Split the `a/<old path> b/<new path>` header of a git diff section into the old and new paths, without their prefixes."""
+
+    # Unless the file was renamed or copied both paths are the same, which is unambiguous even if the path contains " b/"
+    path_length, remainder = divmod(len(header) - len("a/ b/"), 2)
+    path: str = header[2 : path_length + 2]
+    if not remainder and header == f"a/{path} b/{path}":
+        return path, path
+
+    if not (match := DIFF_GIT_HEADER_PATTERN.fullmatch(header)):
+        return header, header
+
+    return unquote_git_path(match.group("old")).removeprefix("a/"), unquote_git_path(match.group("new")).removeprefix("b/")
+
+
 class PullRequestFileDiff(BaseModel):
     path: str = Field(description="The path of the file.")
     status: Literal["added", "removed", "modified", "renamed", "copied", "changed", "unchanged"] = Field(
@@ -219,18 +279,70 @@ class PullRequestFileDiff(BaseModel):
 
         return pr_file_diff.truncate(truncate=truncate)
 
+    @classmethod
+    def from_unified_diff_section(cls, section: str, truncate: int = 100) -> Self:
+        """Parse the section of a unified (git) diff for a single file, without its leading `diff --git `."""
+
+        header, hunks_separator, hunks = section.partition("\n@@")
+        header_lines: list[str] = header.split("\n")
+
+        # The first line is `a/<old path> b/<new path>`, the rename/copy and ---/+++ lines (when present) are more reliable
+        old_path, new_path = split_diff_git_header(header=header_lines[0])
+
+        status: Literal["added", "removed", "modified", "renamed", "copied", "changed"] = "modified"
+        previous_filename: str | None = None
+        mode_changed: bool = False
+
+        for line in header_lines[1:]:
+            if line.startswith("new file mode "):
+                status = "added"
+            elif line.startswith("deleted file mode "):
+                status = "removed"
+            elif line.startswith("old mode "):
+                mode_changed = True
+            elif line.startswith(("rename from ", "copy from ")):
+                status = "renamed" if line.startswith("rename") else "copied"
+                previous_filename = old_path = unquote_git_path(line.split(" from ", 1)[1])
+            elif line.startswith(("rename to ", "copy to ")):
+                new_path = unquote_git_path(line.split(" to ", 1)[1])
+            elif line.startswith(("--- ", "+++ ")):
+                # Git ends the path with a tab when it contains spaces, and quotes it when it contains special characters
+                path: str = unquote_git_path(line[4:].removesuffix("\t"))
+
+                if path == "/dev/null":
+                    continue
+
+                if line.startswith("---"):
+                    old_path = path.removeprefix("a/")
+                else:
+                    new_path = path.removeprefix("b/")
+
+        patch: str | None = "@@" + hunks.rstrip("\n") if hunks_separator else None
+
+        if status == "modified" and mode_changed and patch is None:
+            status = "changed"
+
+        pr_file_diff: Self = cls(
+            path=old_path if status == "removed" else new_path,
+            status=status,
+            patch=patch,
+            previous_filename=previous_filename,
+        )
+
+        return pr_file_diff.truncate(truncate=truncate)
+
     @property
     def lines(self) -> list[str]:
         return self.patch.split("\n") if self.patch else []
 
     def truncate(self, truncate: int) -> Self:
-        lines: list[str] = self.lines
+        # Most patches are within the limit, counting their newlines avoids splitting and rejoining them
+        if not self.patch or self.patch.count("\n") < truncate:
+            return self
 
-        if len(lines) > truncate:
-            lines = lines[:truncate]
-            return self.model_copy(update={"patch": "\n".join(lines), "truncated": True})
+        lines: list[str] = self.patch.split("\n", truncate)[:truncate]
 
-        return self
+        return self.model_copy(update={"patch": "\n".join(lines), "truncated": True})
 
 
 class PullRequestDiff(BaseModel):
@@ -241,3 +353,15 @@ class PullRequestDiff(BaseModel):
         return cls(
             file_diffs=[PullRequestFileDiff.from_diff_entry(diff_entry=diff_entry, truncate=truncate) for diff_entry in diff_entries]
         )
+
+    @classmethod
+    def from_unified_diff(cls, diff: str, truncate: int = 100) -> Self:
+        """Parse a unified (git) diff, as returned by the `diff` media type, into per-file diffs."""
+
+        sections: list[str] = re.split(r"^diff --git ", diff, flags=re.MULTILINE)
+
+        return cls(
+            file_diffs=[
+                PullRequestFileDiff.from_unified_diff_section(section=section, truncate=truncate) for section in sections if section.strip()
+            ]
+        )
@@ -1,20 +1,22 @@
 """The entrypoint for the publicly hosted Agents.md Generator MCP Server."""
 
+import asyncio
 import os
 from pathlib import Path
 from typing import Any, Literal
 
 import click
-from fastmcp.server.middleware.logging import LoggingMiddleware
 from fastmcp.server.server import FastMCP
 from fastmcp.tools import Tool, forward_raw
 from fastmcp.tools.tool import ToolResult
 from fastmcp.tools.tool_transform import TransformedTool
 from fastmcp.utilities.logging import configure_logging, get_logger
 
-from github_research_mcp.clients.github import GitHubResearchClient
+from github_research_mcp.clients.github import GitHubResearchClient, get_github_research_client
 from github_research_mcp.sampling.handler import get_sampling_handler
 from github_research_mcp.servers.code import CodeServer
+from github_research_mcp.servers.shared.middleware import new_logging_middleware
+from github_research_mcp.utilities.event_loop import get_event_loop_factory
 from github_research_mcp.utilities.stars import check_minimum_stars, check_owner_allowlist, get_minimum_stars
 
 configure_logging()
@@ -24,10 +26,9 @@ logger = get_logger(__name__)
 
 def new_mcp_server():
     clone_dir: Path = Path(os.getenv("CLONE_DIR", "tmp"))
-    if not clone_dir.exists():
-        clone_dir.mkdir(parents=True, exist_ok=True)
+    clone_dir.mkdir(parents=True, exist_ok=True)
 
-    research_client: GitHubResearchClient = GitHubResearchClient()
+    research_client: GitHubResearchClient = get_github_research_client()
     code_server: CodeServer = CodeServer(logger=logger, clone_dir=clone_dir)
 
     async def validate_code_search(owner: str, repo: str, **kwargs: Any) -> ToolResult:  # pyright: ignore[reportAny]
@@ -50,7 +51,7 @@ def new_mcp_server():
         sampling_handler=get_sampling_handler(),
         sampling_handler_behavior="always",
         tools=[validated_code_search_tool],
-        middleware=[LoggingMiddleware(include_payloads=True, logger=get_logger(__name__))],
+        middleware=[new_logging_middleware(logger=logger)],
     )
 
 
@@ -59,10 +60,14 @@ mcp: FastMCP[None] = new_mcp_server()
 
 @click.command()
 @click.option(
-    "--mcp-transport", type=click.Choice(["stdio", "streamable-http"]), default="stdio", help="The transport to run the MCP server on"
+    "--mcp-transport",
+    type=click.Choice(["stdio", "streamable-http"]),
+    default="stdio",
+    envvar="MCP_TRANSPORT",
+    help="The transport to run the MCP server on",
 )
 def run_mcp(mcp_transport: Literal["stdio", "streamable-http"]):
-    mcp.run(transport=mcp_transport)
+    asyncio.run(mcp.run_async(transport=mcp_transport), loop_factory=get_event_loop_factory())
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from logging import Logger
 from pathlib import Path
@@ -5,14 +6,15 @@ from typing import Literal
 
 import click
 from fastmcp import FastMCP
-from fastmcp.server.middleware.logging import LoggingMiddleware
 from fastmcp.utilities.logging import get_logger
 
-from github_research_mcp.clients.github import GitHubResearchClient
+from github_research_mcp.clients.github import get_github_research_client
 from github_research_mcp.sampling.handler import get_sampling_handler
 from github_research_mcp.servers.code import CodeServer
 from github_research_mcp.servers.research import ResearchServer
+from github_research_mcp.servers.shared.middleware import new_logging_middleware
 from github_research_mcp.servers.summary import SummaryServer
+from github_research_mcp.utilities.event_loop import get_event_loop_factory
 
 logger: Logger = get_logger(name=__name__)
 
@@ -23,9 +25,9 @@ mcp: FastMCP[None] = FastMCP[None](
     sampling_handler=get_sampling_handler() if enable_summaries else None,
 )
 
-mcp.add_middleware(middleware=LoggingMiddleware(include_payloads=True, logger=logger))
+mcp.add_middleware(middleware=new_logging_middleware(logger=logger))
 
-research_server: ResearchServer = ResearchServer(research_client=GitHubResearchClient(), logger=logger)
+research_server: ResearchServer = ResearchServer(research_client=get_github_research_client(), logger=logger)
 _ = research_server.register_tools(fastmcp=mcp)
 
 if enable_summaries:
@@ -41,10 +43,11 @@ if enable_summaries:
     "--mcp-transport",
     type=click.Choice(["stdio", "streamable-http"]),
     default="stdio",
+    envvar="MCP_TRANSPORT",
     help="The transport to run the MCP server on",
 )
 def run_mcp(mcp_transport: Literal["stdio", "streamable-http"]):
-    mcp.run(transport=mcp_transport)
+    asyncio.run(mcp.run_async(transport=mcp_transport), loop_factory=get_event_loop_factory())
 
 
 if __name__ == "__main__":
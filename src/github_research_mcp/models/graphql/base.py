@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import cache
 from typing import Any
 
 from pydantic import BaseModel
@@ -13,6 +14,12 @@ class BaseGqlQuery(BaseModel, ABC):  # pyright: ignore[reportUnsafeMultipleInher
     @abstractmethod
     def graphql_query() -> str: ...
 
+    @classmethod
+    @cache
+    def cached_graphql_query(cls) -> str:
+        """The query document, built once per query model since it does not change."""
+        return cls.graphql_query()
+
 
 def extract_nodes(value: Any) -> list[Any]:  # pyright: ignore[reportAny]
     if isinstance(value, dict):
@@ -0,0 +1,85 @@
+from collections.abc import Sequence
+from textwrap import dedent
+from typing import Any, override
+
+from pydantic import BaseModel, Field
+
+from github_research_mcp.models.graphql.base import BaseGqlQuery
+
+# The number of files fetched by a single GqlGetBlobs query, unused slots are skipped with @include
+GET_BLOBS_BATCH_SIZE = 20
+
+
+class GqlBlob(BaseModel):
+    """A git object fetched by expression, only blobs have their text populated."""
+
+    object_type: str = Field(validation_alias="__typename")
+    text: str | None = None
+    is_binary: bool | None = Field(default=None, validation_alias="isBinary")
+    is_truncated: bool = Field(default=False, validation_alias="isTruncated")
+
+    @property
+    def is_blob(self) -> bool:
+        return self.object_type == "Blob"
+
+    @staticmethod
+    def graphql_fragments() -> set[str]:
+        fragment = """
+            fragment gqlBlob on Blob {
+                text
+                isBinary
+                isTruncated
+            }
+            """
+        return {dedent(text=fragment)}
+
+
+class GqlGetBlobs(BaseGqlQuery):
+    repository: dict[str, GqlBlob | None]
+
+    def get_blob(self, index: int) -> GqlBlob | None:
+        """Get the blob for the expression at the given index of the batch."""
+        return self.repository.get(f"file{index}")
+
+    @staticmethod
+    @override
+    def graphql_fragments() -> set[str]:
+        return GqlBlob.graphql_fragments()
+
+    @staticmethod
+    @override
+    def graphql_query() -> str:
+        fragments = "\n".join(GqlGetBlobs.graphql_fragments())
+
+        # Each slot aliases an object lookup so that the whole batch is fetched in a single request
+        variables = ", ".join(f"$expression{i}: String, $include{i}: Boolean!" for i in range(GET_BLOBS_BATCH_SIZE))
+        objects = "\n".join(
+            f"        file{i}: object(expression: $expression{i}) @include(if: $include{i}) {{ __typename ...gqlBlob }}"
+            for i in range(GET_BLOBS_BATCH_SIZE)
+        )
+
+        query = (
+            f"query GqlGetBlobs($owner: String!, $repo: String!, {variables}) {{\n"
+            "    repository(owner: $owner, name: $repo) {\n"
+            f"{objects}\n"
+            "    }\n"
+            "}\n"
+        )
+
+        return fragments + "\n" + query
+
+    @staticmethod
+    def to_graphql_query_variables(owner: str, repo: str, expressions: Sequence[str]) -> dict[str, Any]:
+        """Build the variables for a batch of up to GET_BLOBS_BATCH_SIZE `<ref>:<path>` expressions."""
+
+        if len(expressions) > GET_BLOBS_BATCH_SIZE:
+            msg = f"Expected at most {GET_BLOBS_BATCH_SIZE} expressions, got {len(expressions)}"
+            raise ValueError(msg)
+
+        variables: dict[str, Any] = {"owner": owner, "repo": repo}
+
+        for i in range(GET_BLOBS_BATCH_SIZE):
+            variables[f"expression{i}"] = expressions[i] if i < len(expressions) else None
+            variables[f"include{i}"] = i < len(expressions)
+
+        return variables
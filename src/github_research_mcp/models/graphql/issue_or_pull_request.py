@@ -100,8 +100,9 @@ class TimelineItem(BaseModel):
 
 
 class GqlPullRequestWithDetails(PullRequest):
-    comments: list[Comment]
-    timeline_items: list[TimelineItem] = Field(validation_alias=AliasChoices("timelineItems", "timeline_items"))
+    # Comments and timeline items are skipped by the queries when their limit is zero
+    comments: list[Comment] = Field(default_factory=list)
+    timeline_items: list[TimelineItem] = Field(default_factory=list, validation_alias=AliasChoices("timelineItems", "timeline_items"))
 
     @field_validator("comments", mode="before")
     @classmethod
@@ -159,18 +160,21 @@ class GqlGetPullRequest(BaseGqlQuery):
                 $pull_request_number: Int!
                 $limit_comments: Int!
                 $limit_events: Int!
+                $include_comments: Boolean!
+                $include_events: Boolean!
             ) {
                 repository(owner: $owner, name: $repo) {
                     issueOrPullRequest(number: $pull_request_number) {
                         ... on PullRequest {
                             ...gqlPullRequest
 
-                            comments(last: $limit_comments) {
+                            comments(last: $limit_comments) @include(if: $include_comments) {
                                 nodes {
                                     ...gqlComment
                                 }
                             }
-                            timelineItems( itemTypes: [CROSS_REFERENCED_EVENT, REFERENCED_EVENT], last: $limit_events) {
+                            timelineItems(itemTypes: [CROSS_REFERENCED_EVENT, REFERENCED_EVENT], last: $limit_events)
+                                @include(if: $include_events) {
                                 nodes {
                                     ... on CrossReferencedEvent {
                                         actor {
@@ -221,12 +225,15 @@ class GqlGetPullRequest(BaseGqlQuery):
             "pull_request_number": pull_request_number,
             "limit_comments": limit_comments,
             "limit_events": limit_events,
+            "include_comments": limit_comments > 0,
+            "include_events": limit_events > 0,
         }
 
 
 class GqlIssueWithDetails(Issue):
-    comments: list[Comment]
-    timeline_items: list[TimelineItem] = Field(validation_alias=AliasChoices("timelineItems", "timeline_items"))
+    # Comments and timeline items are skipped by the queries when their limit is zero
+    comments: list[Comment] = Field(default_factory=list)
+    timeline_items: list[TimelineItem] = Field(default_factory=list, validation_alias=AliasChoices("timelineItems", "timeline_items"))
 
     @field_validator("comments", mode="before")
     @classmethod
@@ -284,18 +291,21 @@ class GqlGetIssue(BaseGqlQuery):
                 $issue_number: Int!
                 $limit_comments: Int!
                 $limit_events: Int!
+                $include_comments: Boolean!
+                $include_events: Boolean!
             ) {
                 repository(owner: $owner, name: $repo) {
                     issueOrPullRequest(number: $issue_number) {
                         ... on Issue {
                             ...gqlIssue
 
-                            comments(last: $limit_comments) {
+                            comments(last: $limit_comments) @include(if: $include_comments) {
                                 nodes {
                                     ...gqlComment
                                 }
                             }
-                            timelineItems( itemTypes: [CROSS_REFERENCED_EVENT, REFERENCED_EVENT], last: $limit_events) {
+                            timelineItems(itemTypes: [CROSS_REFERENCED_EVENT, REFERENCED_EVENT], last: $limit_events)
+                                @include(if: $include_events) {
                                 nodes {
                                     ... on CrossReferencedEvent {
                                         actor {
@@ -344,6 +354,8 @@ class GqlGetIssue(BaseGqlQuery):
             "issue_number": issue_number,
             "limit_comments": limit_comments,
             "limit_events": limit_events,
+            "include_comments": limit_comments > 0,
+            "include_events": limit_events > 0,
         }
 
 
@@ -370,18 +382,21 @@ class GqlSearchIssues(BaseGqlQuery):
                 $limit_issues: Int!
                 $limit_comments: Int!
                 $limit_events: Int!
+                $include_comments: Boolean!
+                $include_events: Boolean!
             ) {
                 search(query: $search_query, type: ISSUE, first: $limit_issues) {
                     issueCount
                     nodes {
                         ... on Issue {
                             ...gqlIssue
-                            comments(last: $limit_comments) {
+                            comments(last: $limit_comments) @include(if: $include_comments) {
                                 nodes {
                                     ...gqlComment
                                 }
                             }
-                            timelineItems( itemTypes: [CROSS_REFERENCED_EVENT, REFERENCED_EVENT], last: $limit_events) {
+                            timelineItems(itemTypes: [CROSS_REFERENCED_EVENT, REFERENCED_EVENT], last: $limit_events)
+                                @include(if: $include_events) {
                                 nodes {
                                     ... on CrossReferencedEvent {
                                         actor {
@@ -415,6 +430,8 @@ class GqlSearchIssues(BaseGqlQuery):
             "limit_issues": limit_issues,
             "limit_comments": limit_comments,
             "limit_events": limit_events,
+            "include_comments": limit_comments > 0,
+            "include_events": limit_events > 0,
         }
 
 
@@ -441,18 +458,21 @@ class GqlSearchPullRequests(BaseGqlQuery):
                 $limit_pull_requests: Int!
                 $limit_comments: Int!
                 $limit_events: Int!
+                $include_comments: Boolean!
+                $include_events: Boolean!
             ) {
                 search(query: $search_query, type: ISSUE, first: $limit_pull_requests) {
                     issueCount
                     nodes {
                         ... on PullRequest {
                             ...gqlPullRequest
-                            comments(last: $limit_comments) {
+                            comments(last: $limit_comments) @include(if: $include_comments) {
                                 nodes {
                                     ...gqlComment
                                 }
                             }
-                            timelineItems( itemTypes: [CROSS_REFERENCED_EVENT, REFERENCED_EVENT], last: $limit_events) {
+                            timelineItems(itemTypes: [CROSS_REFERENCED_EVENT, REFERENCED_EVENT], last: $limit_events)
+                                @include(if: $include_events) {
                                 nodes {
                                     ... on CrossReferencedEvent {
                                         actor {
@@ -487,4 +507,6 @@ class GqlSearchPullRequests(BaseGqlQuery):
             "limit_pull_requests": limit_pull_requests,
             "limit_comments": limit_comments,
             "limit_events": limit_events,
+            "include_comments": limit_comments > 0,
+            "include_events": limit_events > 0,
         }
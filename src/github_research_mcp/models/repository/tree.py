@@ -1,6 +1,7 @@
+import re
 from collections import defaultdict
 from collections.abc import Sequence
-from fnmatch import fnmatch
+from fnmatch import fnmatch, translate
 from typing import Self
 
 from githubkit.versions.v2022_11_28.models import GitTree
@@ -13,16 +14,36 @@ def get_file_extension(file_path: str) -> str | None:
     return file_path.split(".")[-1]
 
 
-def matches_pattern(pattern: str, directory_path: str, file_path: str) -> bool:
+def compile_patterns(patterns: Sequence[str] | None) -> list[re.Pattern[str]] | None:
+    """Translate fnmatch patterns into a single compiled alternation once, so that filtering a large tree does not translate
+    them per path and each path is checked with one regex match instead of one per pattern."""
+
+    if patterns is None:
+        return None
+
+    if not patterns:
+        return []
+
+    return [re.compile("|".join(translate(pattern) for pattern in patterns))]
+
+
+def matches_pattern(pattern: str | re.Pattern[str], directory_path: str, file_path: str) -> bool:
     """If the pattern is a regex, it will be matched against the directory_path and file_path.
     if the pattern is not a regex, we do a simple contains check."""
 
     full_path = f"{directory_path}/{file_path}"
 
+    if isinstance(pattern, re.Pattern):
+        return pattern.match(full_path) is not None
+
     return fnmatch(full_path, pattern)
 
 
-def matches_include_exclude(full_path: str, include_patterns: list[str] | None, exclude_patterns: list[str] | None) -> bool:
+def matches_include_exclude(
+    full_path: str,
+    include_patterns: Sequence[str | re.Pattern[str]] | None,
+    exclude_patterns: Sequence[str | re.Pattern[str]] | None,
+) -> bool:
     if exclude_patterns is not None:
         for exclude_pattern in exclude_patterns:
             if matches_pattern(pattern=exclude_pattern, directory_path=full_path, file_path=full_path):
@@ -67,8 +88,8 @@ class RepositoryTreeDirectory(BaseModel):
 
     def to_filtered_directory(
         self,
-        include_patterns: list[str] | None,
-        exclude_patterns: list[str] | None,
+        include_patterns: Sequence[str | re.Pattern[str]] | None,
+        exclude_patterns: Sequence[str | re.Pattern[str]] | None,
     ) -> "RepositoryTreeDirectory":
         files: list[str] = [
             file
@@ -228,20 +249,23 @@ class FilteredRepositoryTree(RepositoryTree):
         include_patterns: list[str] | None,
         exclude_patterns: list[str] | None,
     ) -> Self:
+        compiled_include_patterns: list[re.Pattern[str]] | None = compile_patterns(patterns=include_patterns)
+        compiled_exclude_patterns: list[re.Pattern[str]] | None = compile_patterns(patterns=exclude_patterns)
+
         files = [
             file
             for file in repository_tree.files
             if matches_include_exclude(
                 full_path=file,
-                include_patterns=include_patterns,
-                exclude_patterns=exclude_patterns,
+                include_patterns=compiled_include_patterns,
+                exclude_patterns=compiled_exclude_patterns,
             )
         ]
 
         directories: list[RepositoryTreeDirectory] = [
             directory.to_filtered_directory(
-                include_patterns=include_patterns,
-                exclude_patterns=exclude_patterns,
+                include_patterns=compiled_include_patterns,
+                exclude_patterns=compiled_exclude_patterns,
             )
             for directory in repository_tree.directories
         ]
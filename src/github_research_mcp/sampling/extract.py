@@ -1,17 +1,19 @@
 import json
+from functools import cache
 from textwrap import dedent
 from typing import Any
 
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel
 
 ALLOWED_STRUCTURAL_SAMPLING_TYPES = BaseModel
 
 
+@cache
 def object_in_text_instructions[T: ALLOWED_STRUCTURAL_SAMPLING_TYPES](object_type: type[T], require: bool = False) -> str:
-    """Return instructions for extracting an object from a text string."""
+    """Return instructions for extracting an object from a text string, the instructions only depend on the (immutable)
+    schema of the type so they are generated once per type."""
 
-    type_adapter: TypeAdapter[T] = TypeAdapter[T](object_type)
-    json_schema: dict[str, Any] = type_adapter.json_schema()
+    json_schema: dict[str, Any] = object_type.model_json_schema()
 
     schema_and_example: str = dedent(
         f"""The schema for the object is:
@@ -88,11 +90,11 @@ def extract_json_blocks_from_text(text: str) -> list[str]:
 
 def extract_single_object_from_json_block[T: ALLOWED_STRUCTURAL_SAMPLING_TYPES](json_block_text: str, object_type: type[T]) -> T:
     """Extract an object from a JSON block."""
-    type_adapter: TypeAdapter[T] = TypeAdapter[T](object_type)
 
     json_text: str = "\n".join([line.strip() for line in json_block_text.splitlines()])
 
-    return type_adapter.validate_json(json_text)
+    # Models carry a validator built when the class is defined, building a TypeAdapter would rebuild it on every call
+    return object_type.model_validate_json(json_text)
 
 
 def extract_single_object_from_text[T: ALLOWED_STRUCTURAL_SAMPLING_TYPES](text: str, object_type: type[T]) -> T:
@@ -357,7 +357,8 @@ class CodeServer:
             msg = f"Cannot get more than {GET_FILES_LIMIT} files from a repository."
             raise ValueError(msg)
 
-        return [await repository_entry.get_file(path=path, truncate_lines=truncate_lines) for path in paths]
+        # Each file is read in a worker thread, reading them concurrently overlaps the file system round-trips
+        return list(await asyncio.gather(*[repository_entry.get_file(path=path, truncate_lines=truncate_lines) for path in paths]))
 
     async def find_files(
         self,
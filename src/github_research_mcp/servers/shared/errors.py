@@ -1,14 +1,32 @@
-ExtraInfoType = dict[str, str | None]
+from collections.abc import Mapping
+from functools import cached_property
+from typing import override
+
+ExtraInfoType = Mapping[str, str | None]
 
 
 class ServerError(Exception):
     """A request error from the GitHub Research server."""
 
+    message: str
+    extra_info: ExtraInfoType | None
+
     def __init__(self, message: str, extra_info: ExtraInfoType | None = None):
-        msg = message
-        if extra_info:
-            msg += " (" + ", ".join([f"{key}: {value}" for key, value in extra_info.items() if value is not None]) + ")"
-        super().__init__(msg)
+        self.message = message
+        self.extra_info = extra_info
+        super().__init__(message)
+
+    @cached_property
+    def rendered_message(self) -> str:
+        """The message with the extra info appended, only rendered when the error is displayed."""
+        if not self.extra_info:
+            return self.message
+
+        return self.message + " (" + ", ".join(f"{key}: {value}" for key, value in self.extra_info.items() if value is not None) + ")"
+
+    @override
+    def __str__(self) -> str:
+        return self.rendered_message
 
 
 class SamplingSupportRequiredError(ServerError):
@@ -0,0 +1,38 @@
+import os
+from logging import Logger
+from typing import Any, override
+
+import mcp.types
+from fastmcp.server.middleware.logging import LoggingMiddleware
+from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+from github_research_mcp.utilities.repository import normalize_owner_repo
+
+# Payloads (such as a full repository summary) are large, so they are only logged when explicitly requested
+log_payloads: bool = os.getenv("LOG_PAYLOADS", "false").lower() in {"1", "true"}
+
+
+def new_logging_middleware(logger: Logger) -> LoggingMiddleware:
+    """Create the logging middleware of an MCP server, which only logs payloads when `LOG_PAYLOADS` is set."""
+    return LoggingMiddleware(include_payloads=log_payloads, logger=logger)
+
+
+class NormalizeOwnerRepoMiddleware(Middleware):
+    """Normalizes the `owner` and `repo` arguments of tool calls before they reach later middleware (like response
+    caching) and the tool itself, so that case and whitespace variants of a repository are treated as one."""
+
+    @override
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next: CallNext[mcp.types.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        arguments: dict[str, Any] | None = context.message.arguments
+
+        if arguments and isinstance(owner := arguments.get("owner"), str) and isinstance(repo := arguments.get("repo"), str):
+            normalized_owner, normalized_repo = normalize_owner_repo(owner=owner, repo=repo)
+
+            context.message.arguments = {**arguments, "owner": normalized_owner, "repo": normalized_repo}
+
+        return await call_next(context)
@@ -81,18 +81,21 @@ class SummaryServer:
 
             raise SamplingSupportRequiredError
 
-    async def _get_info_for_summary(self, repository: Repository, owner: OWNER, repo: REPO) -> str:
+    async def _get_info_for_summary(self, owner: OWNER, repo: REPO) -> tuple[Repository, str]:
+        # None of the requests depend on each other, so the repository metadata is fetched alongside the rest
         tasks: tuple[
+            CoroutineType[Any, Any, Repository],
             CoroutineType[Any, Any, list[RepositoryFileWithContent]],
             CoroutineType[Any, Any, RepositoryTree],
             CoroutineType[Any, Any, list[RepositoryFileCountEntry]],
         ] = (
+            self.research_server.research_client.get_repository(owner=owner, repo=repo),
             self.research_server.get_readmes(owner=owner, repo=repo),
             self.research_server.research_client.get_repository_tree(owner=owner, repo=repo),
             self.research_server.get_file_extension_statistics(owner=owner, repo=repo, top_n=SUMMARY_EXTENSION_STATISTICS_TOP_N),
         )
 
-        readmes, repository_tree, file_extension_statistics = await asyncio.gather(*tasks)
+        repository, readmes, repository_tree, file_extension_statistics = await asyncio.gather(*tasks)
 
         user_prompt: str = f"""# Repository Information
 The following is the information about the repository:
@@ -117,7 +120,7 @@ The following is first {SUMMARY_REPOSITORY_TREE_DEPTH} levels deep of the reposi
 {dump_model_as_yaml(PrunedRepositoryTree.from_repository_tree(repository_tree, depth=SUMMARY_REPOSITORY_TREE_DEPTH).directories)}
 """
 
-        return user_prompt
+        return repository, user_prompt
 
     def _code_server_tools_client(self, owner: OWNER, repo: REPO) -> Client[Any]:
         if not self.code_server:
@@ -147,11 +150,9 @@ The following is first {SUMMARY_REPOSITORY_TREE_DEPTH} levels deep of the reposi
         return Client[Any](transport=fastmcp)
 
     async def summarize_repository(self, owner: OWNER, repo: REPO) -> RepositorySummary:
-        repository: Repository = await self.research_server.research_client.get_repository(owner=owner, repo=repo)
-
         tools_client = self._code_server_tools_client(owner=owner, repo=repo)
 
-        initial_user_prompt = await self._get_info_for_summary(repository=repository, owner=owner, repo=repo)
+        repository, initial_user_prompt = await self._get_info_for_summary(owner=owner, repo=repo)
 
         instructions = """
 # Tool Usage and Rounds
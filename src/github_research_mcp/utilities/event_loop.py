@@ -0,0 +1,16 @@
+import asyncio
+from collections.abc import Callable
+
+try:
+    import uvloop  # pyright: ignore[reportMissingImports]
+except ImportError:  # uvloop is an optional speedup and is not available on Windows
+    uvloop = None
+
+
+def get_event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get the uvloop event loop factory if uvloop is installed, otherwise None for the default asyncio event loop."""
+
+    if uvloop is None:
+        return None
+
+    return uvloop.new_event_loop  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
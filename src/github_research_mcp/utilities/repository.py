@@ -0,0 +1,12 @@
+def normalize_owner_repo(owner: str, repo: str) -> tuple[str, str]:
+    """Normalize an owner and repository name so that equivalent spellings (`Facebook/React`, ` facebook/react/ `)
+    produce the same values. GitHub treats owner and repository names case-insensitively."""
+
+    normalized_owner: str = owner.strip().strip("/").lower()
+    normalized_repo: str = repo.strip().strip("/").lower()
+
+    if not normalized_owner or not normalized_repo:
+        msg = f"Owner and repository must not be empty, got {owner!r}/{repo!r}"
+        raise ValueError(msg)
+
+    return normalized_owner, normalized_repo
@@ -1,39 +1,60 @@
 import os
+from collections.abc import Collection
+from functools import cache
 from typing import TYPE_CHECKING
 
+from cachetools import TTLCache
+
 from github_research_mcp.clients.github import GitHubResearchClient
 
 if TYPE_CHECKING:
     from github_research_mcp.clients.models.github import Repository
 
 
+REPOSITORY_STARS_CACHE_TTL_SECONDS = 60 * 60
+REPOSITORY_STARS_CACHE_MAX_ENTRIES = 4096
+
+# Star counts barely move on the scale of an hour, so they are cached in-process by (owner, repo)
+repository_stars_cache: TTLCache[tuple[str, str], int] = TTLCache(
+    maxsize=REPOSITORY_STARS_CACHE_MAX_ENTRIES, ttl=REPOSITORY_STARS_CACHE_TTL_SECONDS
+)
+
+
 def get_minimum_stars():
     return int(os.getenv("MINIMUM_STARS", "10"))
 
 
-def get_owner_allowlist():
-    return [owner.strip() for owner in (os.getenv("OWNER_ALLOWLIST", "").split(","))]
+@cache
+def get_owner_allowlist() -> frozenset[str]:
+    """Get the lowercased owners from the comma-separated `OWNER_ALLOWLIST`, parsed once per process."""
+    return frozenset(owner.strip().lower() for owner in os.getenv("OWNER_ALLOWLIST", "").split(",") if owner.strip())
 
 
 async def check_minimum_stars(research_client: GitHubResearchClient, owner: str, repo: str, minimum_stars: int | None = None) -> bool:
-    repository: Repository | None = await research_client.get_repository(owner=owner, repo=repo, error_on_not_found=False)
+    key: tuple[str, str] = (owner.lower(), repo.lower())
+
+    if (stars := repository_stars_cache.get(key)) is None:
+        repository: Repository | None = await research_client.get_repository(owner=owner, repo=repo, error_on_not_found=False)
+
+        if repository is None:
+            msg = f"Repository {owner}/{repo} does not exist or access is not authorized"
+            raise ValueError(msg)
 
-    if repository is None:
-        msg = f"Repository {owner}/{repo} does not exist or access is not authorized"
-        raise ValueError(msg)
+        stars = repository_stars_cache[key] = repository.stars
 
     if minimum_stars is None:
         minimum_stars = get_minimum_stars()
 
-    if repository.stars < minimum_stars:
+    if stars < minimum_stars:
         msg = f"Repository {owner}/{repo} has less than {minimum_stars} stars and is not eligible for summarization"
         return False
 
     return True
 
 
-def check_owner_allowlist(owner: str, owner_allowlist: list[str] | None = None) -> bool:
+def check_owner_allowlist(owner: str, owner_allowlist: Collection[str] | None = None) -> bool:
+    """Check if the owner is in the (lowercased) owner allowlist."""
     if owner_allowlist is None:
         owner_allowlist = get_owner_allowlist()
 
-    return owner in owner_allowlist
+    return owner.lower() in owner_allowlist
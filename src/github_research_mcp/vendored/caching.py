@@ -10,6 +10,7 @@ from typing import Any, ClassVar, Literal, NotRequired, Protocol, Self, TypedDic
 
 import mcp.types
 from cachetools import TLRUCache
+from fastmcp.exceptions import ToolError
 from fastmcp.prompts.prompt import Prompt
 from fastmcp.resources.resource import Resource
 from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
@@ -42,6 +43,9 @@ ONE_MB_IN_BYTES = 1024 * 1024
 
 GLOBAL_KEY = "__global__"
 
+TOOL_RESULT_COLLECTION = "tools/call"
+TOOL_ERROR_COLLECTION = "tools/call/error"
+
 CachableValueTypes = ToolResult | list[Tool] | list[Resource] | list[Prompt] | list[ReadResourceContents] | GetPromptResult
 
 CachableValueTypesVar = TypeVar("CachableValueTypesVar", bound=CachableValueTypes)
@@ -80,9 +84,15 @@ class ToolResultCacheEntry(BaseCacheEntry):
         if isinstance(value, ToolResult):
             return value
 
-        content_block_type_adapter: TypeAdapter[list[mcp.types.ContentBlock]] = get_cached_typeadapter(list[mcp.types.ContentBlock])
+        content_block_type_adapter: TypeAdapter[mcp.types.ContentBlock] = get_cached_typeadapter(mcp.types.ContentBlock)
 
-        content = content_block_type_adapter.validate_python(value.get("content"))
+        # Cached values were serialized by this entry, so plain text blocks are constructed without re-validation
+        content = [
+            mcp.types.TextContent.model_construct(**item)
+            if item.get("type") == "text" and item.get("annotations") is None
+            else content_block_type_adapter.validate_python(item)
+            for item in value.get("content") or []
+        ]
 
         structured_content = value.get("structured_content")
 
@@ -99,6 +109,13 @@ class ToolResultCacheEntry(BaseCacheEntry):
         }
 
 
+class ToolErrorCacheEntry(BaseCacheEntry):
+    """A negative cache entry for a tool call that raised a `ToolError`. The value is the error message."""
+
+    collection: Literal["tools/call/error"] = Field(default="tools/call/error")
+    value: str
+
+
 class ListToolsCacheEntry(BaseCacheEntry):
     collection: Literal["tools/list"] = Field(default="tools/list")
     value: list[Tool]
@@ -226,6 +243,7 @@ CacheEntryTypes = (
     | ReadResourceCacheEntry
     | ListResourcesCacheEntry
     | ToolResultCacheEntry
+    | ToolErrorCacheEntry
     | ListToolsCacheEntry
 )
 
@@ -241,6 +259,14 @@ class CacheProtocol(Protocol):
     ) -> CacheEntryTypes | None:
         """Get a cache entry from the cache."""
 
+    async def get_entries(
+        self,
+        collection_keys: Sequence[tuple[str, str]],
+    ) -> list[CacheEntryTypes | None]:
+        """Get multiple cache entries from the cache, in the order of the collection and key pairs. Backends that
+        support batched reads should override this to fetch all of the entries in a single request."""
+        return [await self.get_entry(collection=collection, key=key) for collection, key in collection_keys]
+
     async def set_entry(
         self,
         cache_entry: CacheEntryTypes,
@@ -418,11 +444,19 @@ class ListPromptsSettings(SharedMethodSettings):
     """Configuration options for Prompt-related caching."""
 
 
+class ToolSettings(SharedMethodSettings):
+    """Configuration options for caching the calls to a specific tool."""
+
+    negative_ttl: NotRequired[int]
+    """The TTL for `ToolError`s raised by the tool. If not set, errors are not cached."""
+
+
 class CallToolSettings(SharedMethodSettings):
     """Configuration options for Tool-related caching."""
 
     included_tools: NotRequired[list[str]]
     excluded_tools: NotRequired[list[str]]
+    tool_settings: NotRequired[dict[str, ToolSettings]]
 
 
 class ReadResourceSettings(SharedMethodSettings):
@@ -572,12 +606,38 @@ class ResponseCachingMiddleware(Middleware):
         if not self._matches_tool_cache_settings(context=context):
             return await call_next(context=context)
 
-        return await self._cached_call_next(
-            context=context,
-            call_next=call_next,
-            key=_make_call_tool_cache_key(msg=context.message),
+        key: str = _make_call_tool_cache_key(msg=context.message)
+
+        negative_ttl: int | None = self._get_tool_settings(context=context).get("negative_ttl")
+
+        if negative_ttl is None:
+            return await self._cached_call_next(context=context, call_next=call_next, key=key)
+
+        # The cached error and the cached result are looked up together so that batching backends need a single request
+        cached_error, cached_result = await self._backend.get_entries(
+            collection_keys=[(TOOL_ERROR_COLLECTION, key), (TOOL_RESULT_COLLECTION, key)],
         )
 
+        if cached_error:
+            self._stats.mark_hit(collection=TOOL_ERROR_COLLECTION)
+            raise ToolError(cached_error.value)
+
+        if cached_result:
+            self._stats.mark_hit(collection=TOOL_RESULT_COLLECTION)
+            return cached_result.value
+
+        self._stats.mark_miss(collection=TOOL_RESULT_COLLECTION)
+
+        try:
+            result: ToolResult = await call_next(context)
+        except ToolError as e:
+            # Errors wrapped by FastMCP carry a cause and may be transient, only errors raised by the tool itself are cached
+            if e.__cause__ is None:
+                await self._backend.set_entry(cache_entry=ToolErrorCacheEntry(key=key, value=str(e), ttl=negative_ttl))
+            raise
+
+        return await self._store_in_cache_and_return(context=context, key=key, value=result)
+
     @override
     async def on_read_resource(
         self,
@@ -742,6 +802,19 @@ class ResponseCachingMiddleware(Middleware):
 
         return True
 
+    def _get_tool_settings(self, context: MiddlewareContext[mcp.types.CallToolRequestParams]) -> ToolSettings:
+        """Get the cache settings for the specific tool being called."""
+
+        tool_call_cache_settings: CallToolSettings | None = self._get_cache_settings(
+            context=context,
+            settings_type=CallToolSettings,
+        )
+
+        if not tool_call_cache_settings or not (tool_settings := tool_call_cache_settings.get("tool_settings")):
+            return ToolSettings()
+
+        return tool_settings.get(context.message.name, ToolSettings())
+
     def _get_cache_settings(
         self,
         context: MiddlewareContext[Any],
@@ -762,6 +835,9 @@ class ResponseCachingMiddleware(Middleware):
     def _get_cache_ttl(self, context: MiddlewareContext[Any]) -> int:
         """Get the cache TTL for a method."""
 
+        if context.method == "tools/call" and "ttl" in (tool_settings := self._get_tool_settings(context=context)):
+            return tool_settings["ttl"]
+
         settings: SharedMethodSettings | None = self._get_cache_settings(context=context)
 
         if not settings or "ttl" not in settings:
@@ -1,5 +1,8 @@
 import asyncio
+import base64
 import json
+import zlib
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Annotated, Any
 
@@ -34,9 +37,26 @@ DEFAULT_MAPPING = {
             "doc_values": False,
             "ignore_above": 256,
         },
+        "compressed_value": {
+            "type": "binary",
+        },
     },
 }
 
+# Values larger than this (in bytes, once serialized) are zlib compressed before being stored
+DEFAULT_COMPRESSION_THRESHOLD = 2048
+DEFAULT_COMPRESSION_LEVEL = 6
+
+
+def compress_value(value: bytes) -> str:
+    """Compress a serialized (utf-8 encoded) value and base64 encode it for storage in a binary field."""
+    return base64.b64encode(zlib.compress(value, DEFAULT_COMPRESSION_LEVEL)).decode("ascii")
+
+
+def decompress_value(compressed_value: str) -> str:
+    """Decode and decompress a value stored in a binary field."""
+    return zlib.decompress(base64.b64decode(compressed_value)).decode("utf-8")
+
 
 class ElasticsearchCache(CacheProtocol):
     """A cache client that uses Elasticsearch."""
@@ -50,6 +70,7 @@ class ElasticsearchCache(CacheProtocol):
         elasticsearch_client: AsyncElasticsearch,
         index: str | None = None,
         mapping: dict[str, Any] | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
     ):
         """Initialize the Elasticsearch cache.
 
@@ -57,10 +78,12 @@ class ElasticsearchCache(CacheProtocol):
             elasticsearch_client: The Elasticsearch client to use.
             index: The index to use for the cache. Defaults to "fastmcp-response-cache".
             mapping: The mapping to use for the cache. Defaults to the default mapping.
+            compression_threshold: The size in bytes above which values are compressed. Defaults to 2KB.
         """
         self.elasticsearch_client = elasticsearch_client
         self.index = index or "fastmcp-response-cache"
         self.mapping = mapping or DEFAULT_MAPPING
+        self.compression_threshold = compression_threshold
         self.setup_called = False
         self.setup_lock = asyncio.Lock()
         self.cached_entry_typeadapter = TypeAdapter(
@@ -78,17 +101,58 @@ class ElasticsearchCache(CacheProtocol):
         if elasticsearch_response.body is None or elasticsearch_response.body.get("error") or not elasticsearch_response.body.get("found"):
             return None
 
-        source = elasticsearch_response.body.get("_source")
-
-        source["value"] = json.loads(source["value"])
-
-        cache_entry = self.cached_entry_typeadapter.validate_python(source)
+        cache_entry = self._cache_entry_from_source(source=elasticsearch_response.body.get("_source"))
         if cache_entry.is_expired():
             await self.delete(collection=collection, key=key)
             return None
 
         return cache_entry
 
+    async def get_entries(self, collection_keys: Sequence[tuple[str, str]]) -> list[CacheEntryTypes | None]:
+        """Get multiple cache entries with a single mget request."""
+        if not collection_keys:
+            return []
+
+        if not self.setup_called:
+            await self.setup()
+
+        collection_key_ids = [self.make_collection_key(collection=collection, key=key) for collection, key in collection_keys]
+
+        elasticsearch_response = await self.elasticsearch_client.options(ignore_status=404).mget(index=self.index, ids=collection_key_ids)
+
+        cache_entries: list[CacheEntryTypes | None] = []
+        expired_entries: list[tuple[str, str]] = []
+
+        # mget returns the documents in the order they were requested
+        for (collection, key), document in zip(collection_keys, elasticsearch_response.body.get("docs", []), strict=False):
+            if document.get("error") or not document.get("found"):
+                cache_entries.append(None)
+                continue
+
+            cache_entry = self._cache_entry_from_source(source=document.get("_source"))
+            if cache_entry.is_expired():
+                expired_entries.append((collection, key))
+                cache_entries.append(None)
+                continue
+
+            cache_entries.append(cache_entry)
+
+        for collection, key in expired_entries:
+            await self.delete(collection=collection, key=key)
+
+        # Pad the results if Elasticsearch returned fewer documents than requested
+        cache_entries.extend([None] * (len(collection_keys) - len(cache_entries)))
+
+        return cache_entries
+
+    def _cache_entry_from_source(self, source: dict[str, Any]) -> CacheEntryTypes:
+        if compressed_value := source.pop("compressed_value", None):
+            source["value"] = json.loads(decompress_value(compressed_value))
+        else:
+            source["value"] = json.loads(source["value"])
+
+        return self.cached_entry_typeadapter.validate_python(source)
+
     async def set_entry(
         self,
         cache_entry: CacheEntryTypes,
@@ -100,7 +164,14 @@ class ElasticsearchCache(CacheProtocol):
 
         document = json.loads(cache_entry.model_dump_json(serialize_as_any=True))
 
-        document["value"] = json.dumps(document["value"])
+        value = json.dumps(document["value"])
+        encoded_value = value.encode("utf-8")
+
+        if len(encoded_value) > self.compression_threshold:
+            del document["value"]
+            document["compressed_value"] = compress_value(encoded_value)
+        else:
+            document["value"] = value
 
         await self.elasticsearch_client.index(
             index=self.index,
@@ -122,12 +193,13 @@ class ElasticsearchCache(CacheProtocol):
                 return
 
             if await self.elasticsearch_client.options(ignore_status=404).indices.exists(index=self.index):
-                return
-
-            await self.elasticsearch_client.options(ignore_status=404).indices.create(
-                index=self.index,
-                mappings=self.mapping,
-            )
+                # Add any fields missing from indices created by earlier versions of the mapping
+                await self.elasticsearch_client.indices.put_mapping(index=self.index, properties=self.mapping["properties"])
+            else:
+                await self.elasticsearch_client.options(ignore_status=404).indices.create(
+                    index=self.index,
+                    mappings=self.mapping,
+                )
 
             self.setup_called = True
 
@@ -1,15 +1,33 @@
+import asyncio
+import inspect
 import re
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
+import httpx
 import pytest
 from dirty_equals import IsDatetime
 from githubkit import GitHub
+from githubkit.core import GitHubCore
+from githubkit.exception import GitHubException
+from githubkit.retry import RetryOption
 from inline_snapshot import snapshot
 
 from github_research_mcp.clients.errors.github import ResourceNotFoundError
 from github_research_mcp.clients.github import (
+    GITHUB_KEEPALIVE_EXPIRY_SECONDS,
+    GITHUB_MAX_CONCURRENT_REQUESTS,
+    GITHUB_MAX_CONNECTIONS,
+    GITHUB_MAX_KEEPALIVE_CONNECTIONS,
+    AdaptiveThrottler,
     GitHubResearchClient,
+    JitteredRetryDecision,
+    PooledGitHubKit,
+    SharedAsyncHTTPTransport,
     build_query,
+    get_githubkit_client,
+    is_githubkit_client_defaults,
+    normalize_keywords,
 )
 from github_research_mcp.clients.models.github import (
     FileLines,
@@ -38,6 +56,120 @@ def test_init():
     assert github_research_client is not None
 
 
+def test_jittered_retry_decision():
+    jittered_retry_decision = JitteredRetryDecision(decision=lambda _, __: RetryOption(True, timedelta(minutes=30)), max_jitter=5)
+
+    # Jitter is added on top of the delay GitHub asks for and stays bounded, even for long rate limit resets
+    for retry_count in range(10):
+        retry_option: RetryOption = jittered_retry_decision(GitHubException(), retry_count)
+        assert retry_option.retry_after is not None
+        assert timedelta(minutes=30) <= retry_option.retry_after <= timedelta(minutes=30, seconds=min(5, 2**retry_count))
+
+    assert JitteredRetryDecision(decision=lambda _, __: RetryOption(False))(GitHubException(), 0) == RetryOption(False)
+
+
+def test_adaptive_throttler():
+    throttler: AdaptiveThrottler = AdaptiveThrottler(max_concurrency=8, min_concurrency=2)
+
+    throttler.record_response(httpx.Response(status_code=403, headers={"retry-after": "60"}))
+    assert throttler.concurrency == 4
+
+    throttler.record_response(httpx.Response(status_code=429, headers={"x-ratelimit-remaining": "0"}))
+    throttler.record_response(httpx.Response(status_code=429, headers={"x-ratelimit-remaining": "0"}))
+    assert throttler.concurrency == 2
+
+    # Forbidden responses that are not rate limits do not change the limit
+    throttler.record_response(httpx.Response(status_code=403))
+    assert throttler.concurrency == 2
+
+    throttler.record_response(httpx.Response(status_code=200))
+    throttler.record_response(httpx.Response(status_code=304))
+    assert throttler.concurrency == 4
+
+
+async def test_pooled_githubkit_shares_transport():
+    githubkit_client: GitHub[Any] = get_githubkit_client()
+    assert isinstance(githubkit_client, PooledGitHubKit)
+
+    requests: list[httpx.Request] = []
+
+    def handle_request(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code=200, json={})
+
+    githubkit_client.async_transports[asyncio.get_running_loop()] = httpx.MockTransport(handle_request)
+
+    # Each request is made with a new httpx client, which all send through the transport of the event loop
+    _ = await githubkit_client.arequest("GET", "/first")
+    _ = await githubkit_client.arequest("GET", "/second")
+
+    assert [request.url.path for request in requests] == ["/first", "/second"]
+
+
+async def test_pooled_githubkit_transport_pool():
+    githubkit_client: GitHub[Any] = get_githubkit_client()
+    assert isinstance(githubkit_client, PooledGitHubKit)
+
+    async_transport = githubkit_client.get_async_transport()
+    assert isinstance(async_transport, SharedAsyncHTTPTransport)
+    assert githubkit_client.get_async_transport() is async_transport
+
+    async with githubkit_client.get_async_client():
+        pass
+
+    # Closing the per-request client leaves the shared pool, and its limits, in place
+    assert githubkit_client.get_async_transport() is async_transport
+    assert (
+        async_transport._pool._max_connections,  # pyright: ignore[reportPrivateUsage]
+        async_transport._pool._max_keepalive_connections,  # pyright: ignore[reportPrivateUsage]
+        async_transport._pool._keepalive_expiry,  # pyright: ignore[reportPrivateUsage]
+        async_transport._pool._http2,  # pyright: ignore[reportPrivateUsage]
+    ) == (GITHUB_MAX_CONNECTIONS, GITHUB_MAX_KEEPALIVE_CONNECTIONS, GITHUB_KEEPALIVE_EXPIRY_SECONDS, True)
+
+
+def test_pooled_githubkit_private_githubkit_api():
+    githubkit_client: GitHub[Any] = get_githubkit_client()
+    assert isinstance(githubkit_client, PooledGitHubKit)
+
+    # PooledGitHubKit overrides these private GitHubKit methods, so a GitHubKit upgrade that changes them must fail here
+    assert is_githubkit_client_defaults(githubkit_client._get_client_defaults())  # pyright: ignore[reportPrivateUsage]
+    assert list(inspect.signature(GitHubCore._arequest).parameters) == snapshot(  # pyright: ignore[reportPrivateUsage]
+        ["self", "method", "url", "params", "content", "data", "files", "json", "headers", "cookies", "stream"]
+    )
+    assert list(inspect.signature(GitHubCore._create_async_client).parameters) == ["self"]  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_pooled_githubkit_throttles_rate_limited_responses():
+    githubkit_client: GitHub[Any] = get_githubkit_client()
+    assert isinstance(githubkit_client, PooledGitHubKit)
+    assert isinstance(throttler := githubkit_client.config.throttler, AdaptiveThrottler)
+
+    responses: list[httpx.Response] = [
+        httpx.Response(status_code=429, headers={"retry-after": "1"}, json={"message": "secondary rate limit"}),
+        httpx.Response(status_code=200, json={}),
+    ]
+    githubkit_client.async_transports[asyncio.get_running_loop()] = httpx.MockTransport(lambda _: responses.pop(0))
+
+    # The rate limited response is retried, it halves the limit and the successful retry grows it back by one
+    response = await githubkit_client.arequest("GET", "/throttled")
+    assert response.status_code == 200
+    assert throttler.concurrency == GITHUB_MAX_CONCURRENT_REQUESTS // 2 + 1
+
+
+def test_build_query():
+    query: str = build_query(owner="strawgate", repo="github-issues-e2e-test", keywords={"zebra", 'say "hi"', "apple"}, is_issue=True)
+    assert query == snapshot('repo:strawgate/github-issues-e2e-test is:issue ("apple" OR "say \\"hi\\"" OR "zebra")')
+
+
+def test_normalize_keywords():
+    assert normalize_keywords({"Error", " error ", "", "  ", "Timeout"}) == {"error", "timeout"}
+
+
+def test_build_query_too_many_keywords():
+    with pytest.raises(ValueError, match=re.escape("Cannot search for more than 6 keywords at once, got 7.")):
+        _ = build_query(owner="strawgate", repo="github-issues-e2e-test", keywords={str(i) for i in range(7)})
+
+
 @pytest.fixture
 def github_research_client(githubkit_client: GitHub[Any]) -> GitHubResearchClient:
     return GitHubResearchClient(githubkit_client=githubkit_client)
@@ -62,6 +194,14 @@ class TestRepositories:
             }
         )
 
+    async def test_get_repository_cached(self, github_research_client: GitHubResearchClient, e2e_repository: E2ERepository):
+        repository: Repository = await github_research_client.get_repository(owner=e2e_repository.owner, repo=e2e_repository.repo)
+        cached_repository: Repository = await github_research_client.get_repository(
+            owner=e2e_repository.owner.upper(), repo=e2e_repository.repo.upper()
+        )
+
+        assert cached_repository is repository
+
     async def test_get_repository_missing(self, github_research_client: GitHubResearchClient, e2e_missing_repository: E2ERepository):
         repository: Repository | None = await github_research_client.get_repository(
             owner=e2e_missing_repository.owner, repo=e2e_missing_repository.repo, error_on_not_found=False
@@ -0,0 +1,126 @@
+from inline_snapshot import snapshot
+
+from github_research_mcp.clients.models.github import PullRequestDiff, RepositoryFileWithContent
+
+UNIFIED_DIFF = """diff --git a/README.md b/README.md
+index 1111111..2222222 100644
+--- a/README.md
++++ b/README.md
+@@ -1,2 +1,2 @@
+ # Title
+-old line
++new line
+diff --git a/new.txt b/new.txt
+new file mode 100644
+index 0000000..3333333
+--- /dev/null
++++ b/new.txt
+@@ -0,0 +1 @@
++hello
+diff --git a/gone.txt b/gone.txt
+deleted file mode 100644
+index 4444444..0000000
+--- a/gone.txt
++++ /dev/null
+@@ -1 +0,0 @@
+-goodbye
+diff --git a/old_name.py b/new_name.py
+similarity index 100%
+rename from old_name.py
+rename to new_name.py
+diff --git a/image.png b/image.png
+index 5555555..6666666 100644
+Binary files a/image.png and b/image.png differ
+diff --git a/script.sh b/script.sh
+old mode 100644
+new mode 100755
+"""
+
+
+def test_pull_request_diff_from_unified_diff():
+    pull_request_diff: PullRequestDiff = PullRequestDiff.from_unified_diff(diff=UNIFIED_DIFF)
+
+    assert pull_request_diff.model_dump() == snapshot(
+        {
+            "file_diffs": [
+                {
+                    "path": "README.md",
+                    "status": "modified",
+                    "patch": "@@ -1,2 +1,2 @@\n # Title\n-old line\n+new line",
+                    "previous_filename": None,
+                    "truncated": False,
+                },
+                {"path": "new.txt", "status": "added", "patch": "@@ -0,0 +1 @@\n+hello", "previous_filename": None, "truncated": False},
+                {
+                    "path": "gone.txt",
+                    "status": "removed",
+                    "patch": "@@ -1 +0,0 @@\n-goodbye",
+                    "previous_filename": None,
+                    "truncated": False,
+                },
+                {"path": "new_name.py", "status": "renamed", "patch": None, "previous_filename": "old_name.py", "truncated": False},
+                {"path": "image.png", "status": "modified", "patch": None, "previous_filename": None, "truncated": False},
+                {"path": "script.sh", "status": "changed", "patch": None, "previous_filename": None, "truncated": False},
+            ]
+        }
+    )
+
+
+def test_pull_request_diff_from_unified_diff_truncated():
+    pull_request_diff: PullRequestDiff = PullRequestDiff.from_unified_diff(diff=UNIFIED_DIFF, truncate=2)
+
+    assert pull_request_diff.file_diffs[0].patch == "@@ -1,2 +1,2 @@\n # Title"
+    assert pull_request_diff.file_diffs[0].truncated is True
+
+
+QUOTED_UNIFIED_DIFF = """diff --git "a/caf\\303\\251.txt" "b/caf\\303\\251.txt"
+index 587be6b..23a2420 100644
+--- "a/caf\\303\\251.txt"
++++ "b/caf\\303\\251.txt"
+@@ -1 +1,2 @@
+ x
++x2
+diff --git a/docs b/my file.txt b/docs b/my file.txt
+index 5626abf..814f4a4 100644
+--- a/docs b/my file.txt\t
++++ b/docs b/my file.txt\t
+@@ -1 +1,2 @@
+ one
++two
+diff --git "a/quote\\"d.txt" b/new name.txt
+similarity index 100%
+rename from "quote\\"d.txt"
+rename to new name.txt
+diff --git a/docs b/gone file.txt b/docs b/gone file.txt
+deleted file mode 100644
+index 5626abf..0000000
+--- a/docs b/gone file.txt\t
++++ /dev/null
+@@ -1 +0,0 @@
+-one
+"""
+
+
+def test_pull_request_diff_from_unified_diff_quoted_paths():
+    pull_request_diff: PullRequestDiff = PullRequestDiff.from_unified_diff(diff=QUOTED_UNIFIED_DIFF)
+
+    assert [(file_diff.path, file_diff.status, file_diff.previous_filename) for file_diff in pull_request_diff.file_diffs] == snapshot(
+        [
+            ("café.txt", "modified", None),
+            ("docs b/my file.txt", "modified", None),
+            ("new name.txt", "renamed", 'quote"d.txt'),
+            ("docs b/gone file.txt", "removed", None),
+        ]
+    )
+
+
+def test_repository_file_with_content_from_text_truncated():
+    text: str = "\n".join(f"line {i}" for i in range(1, 1001))
+
+    repository_file: RepositoryFileWithContent = RepositoryFileWithContent.from_text(
+        path="file.txt", text=text, truncate_lines=3, truncate_characters=100
+    )
+
+    assert repository_file.total_lines == 1000
+    assert repository_file.content is not None
+    assert repository_file.content.root == snapshot({1: "line 1", 2: "line 2", 3: "line 3"})
@@ -12,6 +12,7 @@ from openai import OpenAI
 from pydantic import BaseModel
 
 from github_research_mcp.clients.github import get_githubkit_client
+from github_research_mcp.utilities.stars import repository_stars_cache
 from github_research_mcp.vendored.google_genai import GoogleGenaiSamplingHandler
 
 OPENAI_KEY = os.getenv("OPENAI_API_KEY")
@@ -19,6 +20,12 @@ OPENAI_MODEL = os.getenv("OPENAI_MODEL")
 OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")
 
 
+@pytest.fixture(autouse=True)
+def clear_repository_stars_cache() -> None:
+    """Star counts are cached per process, so each test starts from an empty cache."""
+    repository_stars_cache.clear()
+
+
 @pytest.fixture
 def openai_client() -> OpenAI:
     return OpenAI(api_key=OPENAI_KEY, base_url=OPENAI_BASE_URL)
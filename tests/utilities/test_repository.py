@@ -0,0 +1,13 @@
+import pytest
+
+from github_research_mcp.utilities.repository import normalize_owner_repo
+
+
+def test_normalize_owner_repo() -> None:
+    assert normalize_owner_repo(owner="strawgate", repo="github-issues-e2e-test") == ("strawgate", "github-issues-e2e-test")
+    assert normalize_owner_repo(owner=" Strawgate/", repo="/GitHub-Issues-E2E-Test ") == ("strawgate", "github-issues-e2e-test")
+
+
+def test_normalize_owner_repo_empty() -> None:
+    with pytest.raises(ValueError, match="must not be empty"):
+        _ = normalize_owner_repo(owner=" / ", repo="github-issues-e2e-test")
@@ -20,3 +20,4 @@ async def test_check_minimum_stars(github_research_client: GitHubResearchClient)
 def test_check_owner_allowlist() -> None:
     assert check_owner_allowlist(owner="test") is False
     assert check_owner_allowlist(owner="test", owner_allowlist=["test"]) is True
+    assert check_owner_allowlist(owner="Test", owner_allowlist=frozenset({"test"})) is True